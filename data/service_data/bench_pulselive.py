@@ -0,0 +1,184 @@
+# bench_pulselive.py
+"""
+pulselive API 클라이언트 벤치마크 (로컬 aiohttp 대체 서버 사용).
+
+fixtures / players / stats/player / teams / standings / compseasons 를 합성 데이터로 서빙하며
+응답마다 --latency 만큼 지연을 줍니다. 키 플레이어 선정(keyplayer.py)과 시즌 수집(tablewise_scrapper.py)을
+스레드 풀(requests) 방식과 asyncio 방식으로 각각 실행하여 소요 시간과 요청 수를 비교합니다.
+공정한 비교를 위해 위 실행은 응답 캐시 없이 하고, 마지막으로 임시 캐시로 시즌 수집을 두 번(cold / warm) 실행합니다.
+
+    python bench_pulselive.py --latency 80 --rate 200 --seasons 2
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from aiohttp import web
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'obsolete'))
+from keyplayer import PLKeyPlayerSelector
+from pulselive_async import AsyncPulseliveClient
+from pulselive_cache import ResponseCache
+from pulselive_http import get_shared_limiter
+from tablewise_scrapper import EPLHistoricalScraper
+
+TEAM_IDS = [1, 2, 131, 20, 4, 6, 7, 34, 26, 10, 11, 12, 23, 130, 21, 127, 25, 38, 8, 15]
+PLAYERS_PER_TEAM = 25
+
+
+def build_app(latency):
+    requests_seen = {'count': 0}
+    fixtures = [
+        {
+            'id': 1000 + i,
+            'teams': [{'team': {'id': home}, 'score': i % 4}, {'team': {'id': away}, 'score': i % 3}],
+            'kickoff': {'label': 'Sat 17 Aug 2024, 15:00 BST'},
+            'status': 'C',
+            'ground': {'name': 'Stadium'}
+        }
+        for i, (home, away) in enumerate((h, a) for h in TEAM_IDS for a in TEAM_IDS if h != a)
+    ]
+    players = [
+        {'id': team_id * 100 + i, 'name': {'display': f"Player {team_id}-{i}"},
+         'info': {'position': 'M'}, 'nationalTeam': {'country': 'England'}, 'team_id': team_id}
+        for team_id in TEAM_IDS for i in range(PLAYERS_PER_TEAM)
+    ]
+
+    def page(items, request):
+        page_size = int(request.query.get('pageSize', 100))
+        page_number = int(request.query.get('page', 0))
+        num_pages = max(1, -(-len(items) // page_size))
+        return {'content': items[page_number * page_size:(page_number + 1) * page_size],
+                'pageInfo': {'page': page_number, 'numPages': num_pages, 'pageSize': page_size, 'numEntries': len(items)}}
+
+    @web.middleware
+    async def delay(request, handler):
+        requests_seen['count'] += 1
+        await asyncio.sleep(latency)
+        return await handler(request)
+
+    async def compseasons(request):
+        return web.json_response({'content': [{'label': '2023/24', 'id': 578}, {'label': '2022/23', 'id': 489}]})
+
+    async def fixtures_handler(request):
+        return web.json_response(page(fixtures, request))
+
+    async def players_handler(request):
+        team = request.query.get('teams')
+        items = [p for p in players if team is None or p['team_id'] == int(team)]
+        return web.json_response(page(items, request))
+
+    async def stats_handler(request):
+        player_id = int(request.match_info['player_id'])
+        return web.json_response({'stats': [
+            {'name': 'goals', 'value': player_id % 11}, {'name': 'goal_assist', 'value': player_id % 7},
+            {'name': 'appearances', 'value': 20 + player_id % 15}, {'name': 'mins_played', 'value': 1500}
+        ]})
+
+    async def teams_handler(request):
+        return web.json_response({'content': [
+            {'id': team_id, 'name': f"Team {team_id}", 'shortName': f"T{team_id}", 'grounds': [{'name': 'Stadium', 'capacity': 40000}]}
+            for team_id in TEAM_IDS
+        ]})
+
+    async def standings_handler(request):
+        return web.json_response({'tables': [{'entries': [
+            {'team': {'id': team_id}, 'position': rank + 1, 'played': 38, 'won': 20, 'drawn': 10, 'lost': 8, 'points': 70}
+            for rank, team_id in enumerate(TEAM_IDS)
+        ]}]})
+
+    app = web.Application(middlewares=[delay])
+    app.router.add_get('/football/competitions/1/compseasons', compseasons)
+    app.router.add_get('/football/fixtures', fixtures_handler)
+    app.router.add_get('/football/players', players_handler)
+    app.router.add_get('/football/stats/player/{player_id}', stats_handler)
+    app.router.add_get('/football/teams', teams_handler)
+    app.router.add_get('/football/standings', standings_handler)
+    return app, requests_seen
+
+
+def start_server(app, port):
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, '127.0.0.1', port).start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+
+
+def timed(name, requests_seen, func):
+    get_shared_limiter().hosts.clear()
+    before = requests_seen['count']
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    count = requests_seen['count'] - before
+    print(f"[{name}] {elapsed:.2f}초, 요청 {count}개 ({count / elapsed:.1f} req/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pulselive 클라이언트 벤치마크")
+    parser.add_argument("--latency", type=float, default=80, help="응답 지연 (ms)")
+    parser.add_argument("--rate", type=float, default=200, help="호스트별 초당 요청 수 예산")
+    parser.add_argument("--connections", type=int, default=16, help="asyncio 방식 동시 연결 수")
+    parser.add_argument("--seasons", type=int, default=2, help="시즌 수집 벤치마크 시즌 수")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    app, requests_seen = build_app(args.latency / 1000)
+    start_server(app, args.port)
+    base_url = f"http://127.0.0.1:{args.port}/football"
+    limiter = get_shared_limiter()
+    limiter.target_rate = args.rate
+    limiter.burst = max(1, int(args.rate / 10))
+
+    def keyplayer_threads():
+        selector = PLKeyPlayerSelector(base_url=base_url, use_cache=False)
+        selector.process_matches(selector.get_all_matches())
+
+    def keyplayer_async():
+        asyncio.run(PLKeyPlayerSelector(base_url=base_url, use_cache=False)._run_async(args.connections))
+
+    seasons = [{'label': f"{2023 - i}/{24 - i:02d}", 'id': 578 - i} for i in range(args.seasons)]
+    output_folder = tempfile.mkdtemp(prefix='bench_pulselive_')
+
+    def seasons_threads():
+        scraper = EPLHistoricalScraper(os.path.join(output_folder, 'threads'), base_url=base_url, use_cache=False)
+        for season in seasons:
+            scraper.process_season(season)
+
+    def seasons_async():
+        scraper = EPLHistoricalScraper(os.path.join(output_folder, 'async'), base_url=base_url, use_cache=False)
+
+        async def run():
+            async with AsyncPulseliveClient(base_url, max_connections=args.connections) as client:
+                for season in seasons:
+                    await scraper.process_season_async(client, season)
+        asyncio.run(run())
+
+    timed("keyplayer threads", requests_seen, keyplayer_threads)
+    timed("keyplayer async", requests_seen, keyplayer_async)
+    timed("seasons threads", requests_seen, seasons_threads)
+    timed("seasons async", requests_seen, seasons_async)
+
+    # 끝난 시즌 응답은 만료되지 않으므로 두 번째 실행은 네트워크 요청 없이 처리
+    cache = ResponseCache(os.path.join(output_folder, 'cache.sqlite'))
+
+    def seasons_cached():
+        scraper = EPLHistoricalScraper(os.path.join(output_folder, 'cached'), base_url=base_url, use_cache=False)
+        scraper.cache = scraper.session.cache = cache
+        for season in seasons:
+            scraper.process_season(season)
+
+    timed("seasons threads + cache (cold)", requests_seen, seasons_cached)
+    timed("seasons threads + cache (warm)", requests_seen, seasons_cached)
+    print(f"응답 캐시: {cache.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+
+class CrawlCheckpoint:
+    """
+    stats_crawler 용 추가 전용(append-only) 선수 기록 저장소 + 크롤 매니페스트.
+    선수 한 명을 수집할 때마다 JSON 한 줄을 records_path 에 추가(fsync)하고,
+    팀별 스쿼드 목록은 manifest_path 에 기록하여 재시작 시 스쿼드 페이지와 완료된 선수를 건너뜁니다.
+    """
+
+    def __init__(self, records_path="crawl_player_records.jsonl", manifest_path="crawl_manifest.json"):
+        self.records_path = records_path
+        self.manifest_path = manifest_path
+        self.lock = threading.Lock()
+        self.records = {}
+        self.manifest = {'started_at': datetime.now().isoformat(), 'teams': {}}
+        self.load()
+
+    def load(self):
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        if os.path.exists(self.records_path):
+            with open(self.records_path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 중단 시점에 잘린 마지막 줄은 무시 (해당 선수는 다시 수집)
+                        continue
+                    self.records[entry['url']] = (tuple(entry['order']), entry['record'])
+        if self.records:
+            print(f"체크포인트에서 {len(self.records)}명의 선수 기록을 불러왔습니다.")
+
+    def is_done(self, player_url):
+        return player_url in self.records
+
+    def team_players(self, team_url):
+        """이전 실행에서 기록한 스쿼드 목록 (없으면 None)"""
+        team = self.manifest['teams'].get(team_url)
+        return team['players'] if team else None
+
+    def mark_team(self, team_url, players):
+        with self.lock:
+            self.manifest['teams'][team_url] = {'players': players, 'listed_at': datetime.now().isoformat()}
+            self._write_manifest()
+
+    def append(self, order, player_url, record):
+        entry = {'url': player_url, 'order': list(order), 'record': record}
+        with self.lock:
+            with open(self.records_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self.records[player_url] = (tuple(order), record)
+
+    def results(self):
+        """(순서, 선수 기록) 목록"""
+        with self.lock:
+            return list(self.records.values())
+
+    def finish(self):
+        with self.lock:
+            self.manifest['finished_at'] = datetime.now().isoformat()
+            self.manifest['players_done'] = len(self.records)
+            self._write_manifest()
+
+    def reset(self):
+        """처음부터 다시 수집"""
+        for path in [self.records_path, self.manifest_path]:
+            if os.path.exists(path):
+                os.remove(path)
+        self.records = {}
+        self.manifest = {'started_at': datetime.now().isoformat(), 'teams': {}}
+
+    def _write_manifest(self):
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
@@ -0,0 +1,182 @@
+import atexit
+import queue
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def chromedriver_path():
+    """ChromeDriverManager().install() 은 프로세스당 한 번만 실행"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+
+# 경량 프로필에서 차단할 리소스 (이미지 / 폰트 / 외부 스타일시트 / 광고·분석 스크립트)
+# fotmob 의 클래스 기반 선택자는 JS 가 주입하는 스타일이라 외부 CSS 를 막아도 영향이 없습니다.
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.css',
+    '*googletagmanager.com*', '*google-analytics.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*adservice.google.*', '*amazon-adsystem.com*', '*criteo.*'
+]
+
+
+def build_chrome_options(user_data_dir, lightweight=True):
+    """
+    get_url / stats_crawler 공통 헤드리스 Chrome 옵션.
+    lightweight 이면 이미지를 끄고 DOMContentLoaded 시점에 driver.get() 이 반환되도록(eager) 설정합니다.
+    """
+    options = webdriver.ChromeOptions()
+    if lightweight:
+        options.page_load_strategy = 'eager'
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2
+        })
+    options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    # 브라우저마다 고유한 임시 프로필 폴더를 사용 (세션 충돌 방지)
+    options.add_argument(f'--user-data-dir={user_data_dir}')
+    return options
+
+
+class DriverManager:
+    """
+    미리 띄워 둔(warm) 헤드리스 Chrome 을 여러 호출 / 모듈에서 재사용하는 드라이버 풀.
+    최대 size 개의 브라우저를 유지하며, 한 브라우저가 max_pages 페이지를 처리하면 새 브라우저로 교체하고
+    반납 시 응답하지 않는(크래시) 브라우저는 폐기합니다.
+    lightweight 이면 이미지 / 폰트 / 스타일시트 / 광고 스크립트를 차단한 경량 프로필로 브라우저를 띄웁니다.
+    """
+
+    def __init__(self, size=1, max_pages=200, lightweight=True):
+        self.size = size
+        self.max_pages = max_pages
+        self.lightweight = lightweight
+        self._idle = queue.LifoQueue()
+        self._slots = threading.Semaphore(size)
+        self._size_lock = threading.Lock()
+        self.stats = {'created': 0, 'recycled': 0, 'crashed': 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _create(self):
+        user_data_dir = tempfile.mkdtemp(prefix='selenium_chrome_profile_')
+        driver = webdriver.Chrome(service=Service(chromedriver_path()),
+                                  options=build_chrome_options(user_data_dir, self.lightweight))
+        if self.lightweight:
+            # 리소스 유형별 요청 차단 (CDP)
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        self._count('created')
+        return {'driver': driver, 'pages': 0, 'user_data_dir': user_data_dir}
+
+    def _destroy(self, entry):
+        try:
+            entry['driver'].quit()
+        except Exception:
+            pass
+        shutil.rmtree(entry['user_data_dir'], ignore_errors=True)
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def grow(self, size):
+        """동시에 빌려줄 수 있는 브라우저 수를 size 까지 늘림 (줄이지는 않음)"""
+        with self._size_lock:
+            for _ in range(size - self.size):
+                self._slots.release()
+            self.size = max(self.size, size)
+
+    def warm(self, count=None):
+        """브라우저 시작 비용을 미리 지불 (count 개까지 병렬로 생성)"""
+        count = min(count or self.size, self.size) - self._idle.qsize()
+        if count <= 0:
+            return
+        threads = [threading.Thread(target=lambda: self._idle.put(self._create())) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    @contextmanager
+    def driver(self):
+        """with manager.driver() as driver: 형태로 브라우저 하나를 빌려 한 페이지 작업 수행"""
+        self._slots.acquire()
+        entry = None
+        try:
+            try:
+                entry = self._idle.get_nowait()
+            except queue.Empty:
+                entry = self._create()
+            yield entry['driver']
+        finally:
+            if entry is not None:
+                self._release(entry)
+            self._slots.release()
+
+    def _release(self, entry):
+        entry['pages'] += 1
+        if not self._is_alive(entry['driver']):
+            print("응답하지 않는 브라우저를 폐기합니다.")
+            self._count('crashed')
+            self._destroy(entry)
+        elif entry['pages'] >= self.max_pages:
+            self._count('recycled')
+            self._destroy(entry)
+        else:
+            self._idle.put(entry)
+
+    def close(self):
+        while True:
+            try:
+                self._destroy(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+
+_default_managers = {}
+_default_manager_lock = threading.Lock()
+
+
+def get_driver_manager(size=None, max_pages=None, lightweight=True):
+    """
+    프로세스 공용 드라이버 매니저 (프로필 종류별로 하나, 종료 시 브라우저 정리).
+    이미 있으면 size 가 더 클 때 풀을 늘리고 max_pages 를 갱신하여 같은 브라우저들을 계속 공유합니다.
+    """
+    with _default_manager_lock:
+        manager = _default_managers.get(lightweight)
+        if manager is None:
+            manager = _default_managers[lightweight] = DriverManager(
+                size=size or 1, max_pages=max_pages or 200, lightweight=lightweight
+            )
+            atexit.register(manager.close)
+        else:
+            if size:
+                manager.grow(size)
+            if max_pages:
+                manager.max_pages = max_pages
+        return manager
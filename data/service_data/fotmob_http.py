@@ -0,0 +1,266 @@
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from page_timing import PageTimings
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'fotmob')
+NEXT_DATA_PATTERN = re.compile(r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
+# 브라우저 경로(get_player_details)와 같은 바이오 항목만 사용
+BIO_TITLES = ['height', 'shirt', 'preferred foot', 'market value']
+# parse_player_page 가 읽는 pageProps.data 키 (녹화 시 이 키들은 하위 구조를 그대로 보존)
+PLAYER_DATA_KEYS = ['id', 'name', 'playerInformation', 'positionDescription', 'mainLeague']
+# 페이지 구조 변경 감지용 필수 경로
+REQUIRED_PATHS = [
+    ('props', 'pageProps', 'data', 'playerInformation'),
+    ('props', 'pageProps', 'data', 'positionDescription', 'positions'),
+    ('props', 'pageProps', 'data', 'mainLeague', 'stats'),
+]
+
+
+def create_session(pool_size=10):
+    """재사용 가능한 연결 풀 세션 (keyplayer.py 와 같은 재시도 설정)"""
+    retry_strategy = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_size, pool_maxsize=pool_size))
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml',
+        'Accept-Language': 'en-GB,en;q=0.9'
+    })
+    return session
+
+
+def extract_next_data(html):
+    """페이지에 포함된 Next.js __NEXT_DATA__ JSON (없으면 None)"""
+    match = NEXT_DATA_PATTERN.search(html)
+    if not match:
+        return None
+    try:
+        return json.loads(match.group(1))
+    except json.JSONDecodeError:
+        return None
+
+
+def _text_value(value):
+    """{'fallback': ..., 'numberValue': ...} 형태 또는 단순 값을 화면 표시 문자열로 변환"""
+    if isinstance(value, dict):
+        for key in ['fallback', 'value', 'numberValue']:
+            if value.get(key) not in (None, ''):
+                return str(value[key]).strip()
+        return None
+    return None if value is None else str(value).strip()
+
+
+def _primary_position(position_description):
+    for position in position_description.get('positions') or []:
+        if position.get('isMainPosition'):
+            short = position.get('strPosShort') or {}
+            return (short.get('label') or '').strip() or None
+    return None
+
+
+def parse_player_page(html):
+    """
+    선수 페이지 HTML 의 내장 JSON 에서 get_player_details 와 같은 형태의 정보를 추출합니다.
+    필요한 데이터가 없으면 None 을 반환하며, 이 경우 호출 측에서 브라우저 경로로 대체합니다.
+    """
+    next_data = extract_next_data(html)
+    if not next_data:
+        return None
+    # 없는 선수 / 오류 페이지는 pageProps 가 null 로 내려옴
+    data = ((next_data.get('props') or {}).get('pageProps') or {}).get('data')
+    if not isinstance(data, dict):
+        return None
+
+    details = {}
+    # 1. 바이오 정보
+    for item in data.get('playerInformation') or []:
+        title = (item.get('title') or '').strip().lower()
+        if title in BIO_TITLES:
+            details[title.replace(' ', '_')] = _text_value(item.get('value'))
+
+    # 2. 주 포지션
+    details['primary_position'] = _primary_position(data.get('positionDescription') or {}) or 'N/A'
+
+    # 3. 시즌 성적 (페이지 상단 StatBox 와 같은 대표 리그 시즌 스탯)
+    main_league = data.get('mainLeague') or {}
+    stats = main_league.get('stats')
+    if stats is None:
+        return None
+    season_stats = {}
+    for stat in stats:
+        title = (stat.get('title') or '').strip().lower().replace(' ', '_')
+        if title:
+            season_stats[title] = _text_value(stat.get('value'))
+    details['season_stats'] = season_stats
+    return details
+
+
+def schema_problems(html):
+    """실제 선수 페이지에 필수 경로가 없으면 그 경로 목록 (__NEXT_DATA__ 자체가 없으면 그 사실만)"""
+    next_data = extract_next_data(html)
+    if not next_data:
+        return ['__NEXT_DATA__']
+    problems = []
+    for path in REQUIRED_PATHS:
+        node = next_data
+        for key in path:
+            node = node.get(key) if isinstance(node, dict) else None
+        if node is None:
+            problems.append('.'.join(path))
+    return problems
+
+
+def trim_player_page(html):
+    """
+    녹화한 선수 페이지를 fixture 크기로 줄임: <title> 과 __NEXT_DATA__ 만 남기고,
+    pageProps.data 에서는 PLAYER_DATA_KEYS 만 (값은 원본 그대로) 유지합니다.
+    """
+    next_data = extract_next_data(html)
+    if not next_data:
+        return html
+    data = ((next_data.get('props') or {}).get('pageProps') or {}).get('data')
+    if isinstance(data, dict):
+        next_data['props']['pageProps'] = {'data': {key: data[key] for key in PLAYER_DATA_KEYS if key in data}}
+    title = re.search(r'<title[^>]*>.*?</title>', html, re.DOTALL)
+    payload = json.dumps(next_data, ensure_ascii=False, separators=(',', ':'))
+    return (
+        f'<!DOCTYPE html><html lang="en"><head><meta charSet="utf-8"/>{title.group(0) if title else ""}</head>\n'
+        f'<body><script id="__NEXT_DATA__" type="application/json">{payload}</script></body></html>\n'
+    )
+
+
+def fixture_name(player_url):
+    return re.sub(r'[^A-Za-z0-9_-]+', '_', player_url.rstrip('/').split('/players/')[-1]) + '.html'
+
+
+def fetch_player_details(session, player_url, timings=None, timeout=15, fixture_dir=None):
+    """HTTP 로 선수 페이지를 받아 파싱 (실패 시 None). fixture_dir 이 있으면 줄인 원본 HTML 저장"""
+    started = time.perf_counter()
+    try:
+        response = session.get(player_url, timeout=timeout)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"  - HTTP 요청 실패 ({player_url}): {e}")
+        return None
+    loaded = time.perf_counter()
+    if fixture_dir:
+        os.makedirs(fixture_dir, exist_ok=True)
+        with open(os.path.join(fixture_dir, fixture_name(player_url)), 'w', encoding='utf-8') as f:
+            f.write(trim_player_page(response.text))
+    try:
+        details = parse_player_page(response.text)
+    except (AttributeError, TypeError, ValueError) as e:
+        # 예상과 다른 JSON 구조는 실패로 처리하여 브라우저 경로로 대체되도록 함
+        print(f"  - 선수 페이지 파싱 실패 ({player_url}): {e}")
+        details = None
+    if timings:
+        timings.record('player_http', player_url, loaded - started, time.perf_counter() - loaded, ok=details is not None)
+    return details
+
+
+def parse_fixtures(fixture_dir):
+    """저장된 선수 페이지(*.html)를 오프라인으로 파싱 -> {파일명: details 또는 None}"""
+    results = {}
+    for path in sorted(glob.glob(os.path.join(fixture_dir, '**', '*.html'), recursive=True)):
+        with open(path, encoding='utf-8') as f:
+            results[os.path.relpath(path, fixture_dir)] = parse_player_page(f.read())
+    return results
+
+
+def check_fixtures(fixture_dir=FIXTURE_DIR):
+    """
+    저장된 선수 페이지를 파싱하여 같은 이름의 기대 결과(*.json)와 비교 -> 불일치 파일명 목록.
+    기대 결과 파일이 없는 페이지는 비교하지 않으며, 기대 결과가 있는 정상 페이지는 필수 경로도 검사합니다.
+    synthetic/ 아래는 직접 작성한 페이지이고, 나머지는 --compare --save-fixtures 로 녹화한 실제 페이지입니다.
+    """
+    mismatches = []
+    for name, details in parse_fixtures(fixture_dir).items():
+        expected_path = os.path.join(fixture_dir, os.path.splitext(name)[0] + '.json')
+        if not os.path.exists(expected_path):
+            continue
+        with open(expected_path, encoding='utf-8') as f:
+            expected = json.load(f)
+        if expected is not None:
+            with open(os.path.join(fixture_dir, name), encoding='utf-8') as f:
+                problems = schema_problems(f.read())
+            if problems:
+                print(f"[구조 변경] {name}: 필수 경로 없음 {problems}")
+                mismatches.append(name)
+                continue
+        if details != expected:
+            print(f"[불일치] {name}\n  기대: {expected}\n  결과: {details}")
+            mismatches.append(name)
+    return mismatches
+
+
+def compare_throughput(player_urls, save_fixtures=None):
+    """
+    같은 선수 URL 목록을 HTTP 경로와 브라우저 경로로 순차 처리하여 분당 페이지 수 비교.
+    save_fixtures 가 있으면 줄인 페이지와 함께 브라우저 경로 결과를 기대 결과(*.json)로 저장합니다.
+    """
+    from driver_manager import get_driver_manager
+    from stats_crawler import get_player_details
+
+    session = create_session()
+    http_timings = PageTimings()
+    mismatches = []
+    http_results = {}
+    for url in player_urls:
+        http_results[url] = fetch_player_details(session, url, http_timings, fixture_dir=save_fixtures)
+
+    manager = get_driver_manager(size=1)
+    manager.warm()
+    browser_timings = PageTimings()
+    for url in player_urls:
+        with manager.driver() as driver:
+            browser_details = get_player_details(driver, url, browser_timings)
+        if save_fixtures:
+            expected_path = os.path.join(save_fixtures, os.path.splitext(fixture_name(url))[0] + '.json')
+            with open(expected_path, 'w', encoding='utf-8') as f:
+                json.dump(browser_details, f, ensure_ascii=False, indent=2)
+                f.write('\n')
+        if http_results[url] != browser_details:
+            mismatches.append(url)
+
+    print(f"HTTP 경로:     {http_timings.summary()}")
+    print(f"브라우저 경로: {browser_timings.summary()}")
+    print(f"결과 불일치 {len(mismatches)}건: {mismatches}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="fotmob 선수 페이지 HTTP 추출 도구")
+    parser.add_argument('--fixtures', help="저장된 선수 페이지 HTML 폴더를 오프라인으로 파싱")
+    parser.add_argument('--check', nargs='?', const=FIXTURE_DIR, metavar='FIXTURE_DIR',
+                        help="저장된 페이지의 파싱 결과를 기대 결과(*.json)와 비교 (기본: fixtures/fotmob)")
+    parser.add_argument('--compare', nargs='+', metavar='PLAYER_URL', help="HTTP / 브라우저 경로 처리량 비교")
+    parser.add_argument('--save-fixtures', help="--compare 시 받은 페이지(줄인 HTML)와 브라우저 결과를 저장할 폴더 (예: fixtures/fotmob)")
+    args = parser.parse_args()
+
+    if args.fixtures:
+        for name, details in parse_fixtures(args.fixtures).items():
+            status = "OK " if details else "실패"
+            print(f"[{status}] {name}: {details}")
+    if args.check:
+        mismatches = check_fixtures(args.check)
+        print(f"fixture 검사: 불일치 {len(mismatches)}건")
+        if mismatches:
+            sys.exit(1)
+    if args.compare:
+        compare_throughput(args.compare, args.save_fixtures)
@@ -1,12 +1,15 @@
-import requests
 import pandas as pd
 from datetime import datetime, timedelta
-import time
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
+import argparse
+import asyncio
+
+from pulselive_async import PULSELIVE_BASE_URL, AsyncPulseliveClient
+from pulselive_cache import get_shared_cache
+from pulselive_http import create_pulselive_session, fetch_all_pages, iter_pages
+from season_memo import SeasonMemo
 
 # 로깅 설정
 logging.basicConfig(
@@ -17,9 +20,13 @@ logging.basicConfig(
 logger = logging.getLogger()
 
 class PLKeyPlayerSelector:
-    def __init__(self, season_id=719):
-        self.base_url = "https://footballapi.pulselive.com/football"
+    def __init__(self, season_id=719, memo_path=None, memo_max_age=None, base_url=PULSELIVE_BASE_URL, use_cache=True):
+        self.base_url = base_url
+        # 동기 / 비동기 클라이언트가 공유하는 SQLite 응답 캐시 (끝난 시즌은 만료 없음)
+        self.cache = get_shared_cache() if use_cache else None
         self.season_id = season_id
+        # (시즌, 팀) 스쿼드 / (시즌, 선수) 스탯 메모 - 한 실행에서 같은 API 리소스는 한 번만 요청
+        self.memo = SeasonMemo(memo_path, memo_max_age)
         self.team_names = {
             1: 'Arsenal', 2: 'Aston Villa', 131: 'Brighton', 20: 'Southampton',
             4: 'Chelsea', 6: 'Crystal Palace', 7: 'Everton', 34: 'Fulham',
@@ -28,23 +35,8 @@ class PLKeyPlayerSelector:
             127: 'Bournemouth', 25: 'West Ham', 38: 'Wolves', 8: 'Ipswich'
         }
 
-        # 재시도 전략 설정
-        self.retry_strategy = Retry(
-            total=5,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"],
-            respect_retry_after_header=True
-        )
-
-        # HTTP 세션 설정
-        self.session = requests.Session()
-        self.session.mount("https://", HTTPAdapter(max_retries=self.retry_strategy))
-        self.session.headers.update({
-            'Origin': 'https://www.premierleague.com',
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36',
-            'Accept': 'application/json'
-        })
+        # HTTP 세션 설정 (5xx 재시도 + 프로세스 공용 토큰 버킷 / 429 백오프 / 적응형 동시성)
+        self.session = create_pulselive_session(backoff_factor=0.5, cache=self.cache)
 
     def parse_match_date(self, date_str):
         """날짜 파싱 함수 (BST/GMT 처리)"""
@@ -56,84 +48,74 @@ class PLKeyPlayerSelector:
             logger.error(f"날짜 파싱 실패: {date_str} - {str(e)}")
             return datetime.now()
 
+    def _parse_fixture(self, fixture):
+        home_team = fixture.get('teams', [{}])[0].get('team', {})
+        away_team = fixture.get('teams', [{}])[1].get('team', {})
+        
+        return {
+            'match_id': int(fixture['id']),
+            'home_team_id': int(home_team.get('id', 0)),
+            'away_team_id': int(away_team.get('id', 0)),
+            'match_date': self.parse_match_date(fixture.get('kickoff', {}).get('label', '')),
+            'home_team_name': self.team_names.get(int(home_team.get('id', 0)), 'Unknown'),
+            'away_team_name': self.team_names.get(int(away_team.get('id', 0)), 'Unknown')
+        }
+
     def get_all_matches(self):
         """전체 경기 정보 수집 (정수형 ID 강제 변환)"""
         matches = []
-        page = 0
+        params = {'compSeasons': self.season_id, 'sort': 'asc'}
         
-        while True:
-            try:
-                response = self.session.get(
-                    f"{self.base_url}/fixtures",
-                    params={
-                        'compSeasons': self.season_id,
-                        'pageSize': 100,
-                        'page': page,
-                        'sort': 'asc'
-                    },
-                    timeout=10
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                for fixture in data.get('content', []):
-                    home_team = fixture.get('teams', [{}])[0].get('team', {})
-                    away_team = fixture.get('teams', [{}])[1].get('team', {})
-                    
-                    matches.append({
-                        'match_id': int(fixture['id']),
-                        'home_team_id': int(home_team.get('id', 0)),
-                        'away_team_id': int(away_team.get('id', 0)),
-                        'match_date': self.parse_match_date(fixture.get('kickoff', {}).get('label', '')),
-                        'home_team_name': self.team_names.get(int(home_team.get('id', 0)), 'Unknown'),
-                        'away_team_name': self.team_names.get(int(away_team.get('id', 0)), 'Unknown')
-                    })
-                
-                if page >= data.get('pageInfo', {}).get('numPages', 0) - 1:
-                    break
-                page += 1
-                time.sleep(1)  # 페이지 간 지연
-
-            except Exception as e:
-                logger.error(f"경기 정보 수집 실패: {str(e)}")
-                break
+        try:
+            # page 0 의 numPages 를 읽고 나머지 페이지는 동시에 요청, 도착한 페이지부터 순서대로 처리
+            for content in iter_pages(self.session, f"{self.base_url}/fixtures", params, page_size=100):
+                for fixture in content:
+                    matches.append(self._parse_fixture(fixture))
+        except Exception as e:
+            logger.error(f"경기 정보 수집 실패: {str(e)}")
         
         return matches
 
+    def _fetch_team_players(self, team_id):
+        # 비동기 경로(client.players)와 같이 모든 페이지를 받아 스쿼드가 50명을 넘어도 결과가 같도록 함
+        content = fetch_all_pages(
+            self.session,
+            f"{self.base_url}/players",
+            {'compSeasons': self.season_id, 'teams': int(team_id)},
+            page_size=50
+        )
+        return self._parse_team_players(team_id, content)
+
+    def _parse_team_players(self, team_id, content):
+        return [{
+            'player_id': int(p['id']),
+            'name': p['name']['display'],
+            'position': p.get('info', {}).get('position', ''),
+            'team_id': int(team_id)
+        } for p in content]
+
     def get_team_players(self, team_id):
-        """팀 선수 목록 조회 (정수형 처리)"""
+        """팀 선수 목록 조회 (정수형 처리, 시즌 / 팀 단위 메모)"""
         try:
-            response = self.session.get(
-                f"{self.base_url}/players",
-                params={
-                    'compSeasons': self.season_id,
-                    'teams': int(team_id),
-                    'pageSize': 50
-                },
-                timeout=10
-            )
-            response.raise_for_status()
-            return [{
-                'player_id': int(p['id']),
-                'name': p['name']['display'],
-                'position': p.get('info', {}).get('position', ''),
-                'team_id': int(team_id)
-            } for p in response.json().get('content', [])]
-            
+            return self.memo.get_or_fetch('squad', self.season_id, team_id, lambda: self._fetch_team_players(team_id))
         except Exception as e:
             logger.error(f"선수 목록 조회 실패 (팀 {team_id}): {str(e)}")
             return []
 
+    def _fetch_player_stats(self, player_id):
+        response = self.session.get(
+            f"{self.base_url}/stats/player/{int(player_id)}",
+            params={'compSeasons': self.season_id, 'comps': 1},
+            timeout=10
+        )
+        response.raise_for_status()
+        # 메모에는 점수 계산에 필요한 스탯 목록만 보관
+        return {'stats': response.json().get('stats', [])}
+
     def get_player_stats(self, player_id):
-        """선수 통계 조회 (재시도 적용)"""
+        """선수 통계 조회 (재시도 적용, 시즌 / 선수 단위 메모)"""
         try:
-            response = self.session.get(
-                f"{self.base_url}/stats/player/{int(player_id)}",
-                params={'compSeasons': self.season_id, 'comps': 1},
-                timeout=10
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self.memo.get_or_fetch('stats', self.season_id, player_id, lambda: self._fetch_player_stats(player_id))
             
             stats = {'player_id': int(player_id)}
             for stat in data.get('stats', []):
@@ -166,7 +148,6 @@ class PLKeyPlayerSelector:
                 **player,
                 **stats
             })
-            time.sleep(0.5)  # API 요청 간 지연
         
         if player_scores:
             best_player = max(player_scores, key=lambda x: x['score'])
@@ -208,9 +189,16 @@ class PLKeyPlayerSelector:
         matches = self.get_all_matches()
         logger.info(f"총 {len(matches)}경기 발견")
         
-        # 2. 병렬 처리 (5개 워커로 제한)
+        # 2. 병렬 처리
+        results = self.process_matches(matches)
+        
+        # 3. 결과 저장
+        self.save_results(results)
+
+    def process_matches(self, matches):
+        """스레드 풀 병렬 처리 (실제 동시 요청 수는 세션의 적응형 동시성 한도로 제한)"""
         results = []
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        with ThreadPoolExecutor(max_workers=self.session.concurrency.maximum) as executor:
             futures = {executor.submit(self.process_match, match): match for match in matches}
             
             for i, future in enumerate(as_completed(futures)):
@@ -221,12 +209,74 @@ class PLKeyPlayerSelector:
                         logger.info(f"진행률: {len(results)}/{len(matches)}")
                 except Exception as e:
                     logger.error(f"경기 처리 실패: {str(e)}")
+        return results
+
+    async def prefetch_async(self, client, matches):
+        """경기에 등장하는 팀 스쿼드와 선수 스탯을 비동기로 한 번씩 받아 메모에 저장"""
+        async def fetch_squad(team_id):
+            if self.memo.contains('squad', self.season_id, team_id):
+                return
+            try:
+                content = await client.players(self.season_id, team_id=team_id, page_size=50)
+                self.memo.put('squad', self.season_id, team_id, self._parse_team_players(team_id, content))
+            except Exception as e:
+                logger.error(f"선수 목록 조회 실패 (팀 {team_id}): {str(e)}")
+
+        async def fetch_stats(player_id):
+            if self.memo.contains('stats', self.season_id, player_id):
+                return
+            try:
+                data = await client.player_stats(player_id, self.season_id)
+                self.memo.put('stats', self.season_id, player_id, {'stats': data.get('stats', [])})
+            except Exception as e:
+                logger.error(f"선수 통계 조회 실패 ({player_id}): {str(e)}")
+
+        team_ids = sorted({m['home_team_id'] for m in matches} | {m['away_team_id'] for m in matches})
+        await asyncio.gather(*(fetch_squad(team_id) for team_id in team_ids))
+        player_ids = sorted({
+            player['player_id']
+            for team_id in team_ids if self.memo.contains('squad', self.season_id, team_id)
+            for player in self.get_team_players(team_id)
+        })
+        logger.info(f"{len(team_ids)}개 팀, {len(player_ids)}명 선수 스탯 비동기 수집")
+        await asyncio.gather(*(fetch_stats(player_id) for player_id in player_ids))
+
+    async def _run_async(self, max_connections):
+        async with AsyncPulseliveClient(self.base_url, max_connections=max_connections, cache=self.cache) as client:
+            fixtures = await client.fixtures(self.season_id)
+            matches = [self._parse_fixture(fixture) for fixture in fixtures]
+            logger.info(f"총 {len(matches)}경기 발견")
+            await self.prefetch_async(client, matches)
+        # 필요한 리소스가 모두 메모에 있으므로 경기별 선정은 네트워크 요청 없이 처리
+        return [result for result in map(self.process_match, matches) if result]
+
+    def run_async(self, max_connections=10):
+        """asyncio 실행 모드: 팀 / 선수 리소스를 동시에 받아온 뒤 경기별 키 플레이어 선정"""
+        logger.info("2024/25 프리미어리그 키 플레이어 선정 시작 (async)")
+        results = asyncio.run(self._run_async(max_connections))
+        self.save_results(results)
+
+    def save_results(self, results):
+        self.memo.save()
+        logger.info(f"메모 캐시: {self.memo.stats}")
+        if self.cache is not None:
+            logger.info(f"응답 캐시: {self.cache.summary()}")
         
-        # 3. 결과 저장
         df = pd.DataFrame(results)
         df.to_csv('pl_2024_25_key_players.csv', index=False, encoding='utf-8-sig')
         logger.info(f"CSV 저장 완료: {len(results)}경기 처리됨")
 
 if __name__ == "__main__":
-    selector = PLKeyPlayerSelector()
-    selector.run()
+    parser = argparse.ArgumentParser(description="프리미어리그 키 플레이어 선정")
+    parser.add_argument('--async', dest='use_async', action='store_true', help="asyncio 클라이언트로 실행")
+    parser.add_argument('--base-url', default=PULSELIVE_BASE_URL)
+    parser.add_argument('--no-cache', action='store_true', help="응답 캐시를 사용하지 않음")
+    args = parser.parse_args()
+
+    # 진행 중인 시즌 스탯은 계속 바뀌므로 저장된 메모는 6시간까지만 재사용
+    selector = PLKeyPlayerSelector(memo_path="pl_key_player_memo.json", memo_max_age=6 * 3600, base_url=args.base_url,
+                                   use_cache=not args.no_cache)
+    if args.use_async:
+        selector.run_async()
+    else:
+        selector.run()
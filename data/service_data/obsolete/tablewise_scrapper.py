@@ -1,11 +1,17 @@
-import requests
 import pandas as pd
 import os
+import sys
 import time
 import logging
+import argparse
+import asyncio
 from concurrent.futures import ThreadPoolExecutor
-from urllib3.util.retry import Retry
-from requests.adapters import HTTPAdapter
+
+# data/service_data 의 공용 pulselive 세션 사용
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pulselive_async import PULSELIVE_BASE_URL, AsyncPulseliveClient
+from pulselive_cache import get_shared_cache
+from pulselive_http import create_pulselive_session, iter_pages
 
 # 로깅 설정
 logging.basicConfig(
@@ -19,23 +25,18 @@ logging.basicConfig(
 logger = logging.getLogger()
 
 class EPLHistoricalScraper:
-    def __init__(self, output_folder="epl_historical_data"):
+    def __init__(self, output_folder="epl_historical_data", base_url=PULSELIVE_BASE_URL, use_cache=True):
         self.output_folder = output_folder
-        self.base_url = "https://footballapi.pulselive.com/football"
+        self.base_url = base_url
+        # 동기 / 비동기 클라이언트가 공유하는 SQLite 응답 캐시 (끝난 시즌은 만료 없음)
+        self.cache = get_shared_cache() if use_cache else None
         self.headers = {
             'Origin': 'https://www.premierleague.com',
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36'
         }
         
-        # 세션 설정
-        self.session = requests.Session()
-        retries = Retry(
-            total=5,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
-        )
-        self.session.mount('https://', HTTPAdapter(max_retries=retries))
+        # 세션 설정 (5xx 재시도 + 프로세스 공용 토큰 버킷 / 429 백오프 / 적응형 동시성)
+        self.session = create_pulselive_session(backoff_factor=1, cache=self.cache)
         
         os.makedirs(output_folder, exist_ok=True)
 
@@ -113,34 +114,7 @@ class EPLHistoricalScraper:
         try:
             response = self.session.get(url, params=params, headers=self.headers)
             response.raise_for_status()
-            teams = response.json().get('content', [])
-            
-            team_data = []
-            for team in teams:
-                team_data.append({
-                    'team_id': int(team['id']),
-                    'name': team['name'],
-                    'short_name': team.get('shortName', ''),
-                    'founded': int(team.get('founded', 0)) if team.get('founded') else None,
-                    'stadium': team.get('grounds', [{}])[0].get('name'),
-                    'capacity': int(team.get('grounds', [{}])[0].get('capacity', 0)) if team.get('grounds', [{}])[0].get('capacity') else None
-                })
-            
-            df = pd.DataFrame(team_data)
-            
-            # 정수형 컬럼 변환
-            int_columns = ['team_id']
-            df[int_columns] = df[int_columns].astype('int32')
-            
-            # founded와 capacity는 None 값이 있을 수 있으므로 별도 처리
-            if 'founded' in df.columns:
-                df['founded'] = df['founded'].astype('Int32')  # nullable integer
-            if 'capacity' in df.columns:
-                df['capacity'] = df['capacity'].astype('Int32')  # nullable integer
-            
-            df.to_csv(os.path.join(folder, 'teams.csv'), index=False)
-            logger.info(f"{folder} 팀 정보 저장 완료")
-            return team_data
+            return self._save_teams(response.json().get('content', []), folder)
         except Exception as e:
             logger.error(f"팀 정보 수집 실패: {str(e)}")
             return []
@@ -158,33 +132,7 @@ class EPLHistoricalScraper:
             response.raise_for_status()
             standings = response.json().get('tables', [{}])[0].get('entries', [])
             
-            stats_data = []
-            for entry in standings:
-                stats_data.append({
-                    'team_id': int(entry['team']['id']),
-                    'season_id': int(season_id),
-                    'position': int(entry.get('position', 0)),
-                    'played': int(entry.get('played', 0)),
-                    'wins': int(entry.get('won', 0)),
-                    'draws': int(entry.get('drawn', 0)),
-                    'losses': int(entry.get('lost', 0)),
-                    'goals_for': int(entry.get('goalsFor', 0)),
-                    'goals_against': int(entry.get('goalsAgainst', 0)),
-                    'points': int(entry.get('points', 0)),
-                    'clean_sheets': int(entry.get('cleanSheets', 0)),
-                    'goal_difference': int(entry.get('goalDifference', 0))
-                })
-            
-            df = pd.DataFrame(stats_data)
-            
-            # 정수형으로 명시적 변환
-            int_columns = ['team_id', 'season_id', 'position', 'played', 'wins', 
-                          'draws', 'losses', 'goals_for', 'goals_against', 
-                          'points', 'clean_sheets', 'goal_difference']
-            df[int_columns] = df[int_columns].astype('int32')
-            
-            df.to_csv(os.path.join(folder, 'team_stats.csv'), index=False)
-            logger.info(f"{folder} 팀 통계 저장 완료")
+            self._save_team_stats(standings, season_id, folder)
         except Exception as e:
             logger.error(f"팀 통계 수집 실패: {str(e)}")
 
@@ -193,49 +141,18 @@ class EPLHistoricalScraper:
         url = f"{self.base_url}/players"
         params = {
             'compSeasons': season_id,
-            'pageSize': 100,
-            'page': 0,
             'altIds': 'true'
         }
         
         all_players = []
-        while True:
-            try:
-                response = self.session.get(url, params=params, headers=self.headers)
-                response.raise_for_status()
-                data = response.json()
-                players = data.get('content', [])
-                
-                if not players:
-                    break
-                
-                for player in players:
-                    all_players.append({
-                        'player_id': int(player['id']),
-                        'name': player['name']['display'],
-                        'position': player.get('info', {}).get('position'),
-                        'nationality': player.get('nationalTeam', {}).get('country')
-                    })
-                
-                if params['page'] >= data.get('pageInfo', {}).get('numPages', 0) - 1:
-                    break
-                    
-                params['page'] += 1
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"선수 페이지 {params['page']} 수집 실패: {str(e)}")
-                break
+        try:
+            # page 0 의 numPages 를 읽고 나머지 페이지는 동시에 요청
+            for players in iter_pages(self.session, url, params, page_size=100):
+                all_players.extend(self._parse_players(players))
+        except Exception as e:
+            logger.error(f"선수 페이지 수집 실패: {str(e)}")
         
-        if all_players:
-            df = pd.DataFrame(all_players)
-            
-            # 정수형 컬럼 변환
-            int_columns = ['player_id']
-            df[int_columns] = df[int_columns].astype('int32')
-            
-            df.to_csv(os.path.join(folder, 'players.csv'), index=False)
-            logger.info(f"{folder} 선수 정보 저장 완료")
+        self._save_players(all_players, folder)
         return all_players
 
     def scrape_player_info(self, season_id, players, folder):
@@ -249,43 +166,146 @@ class EPLHistoricalScraper:
                 response.raise_for_status()
                 stats = response.json().get('stats', [])
                 
-                player_info = {
-                    'player_id': int(player['player_id']),
-                    'season_id': int(season_id),
-                    'appearances': 0,
-                    'goals': 0,
-                    'assists': 0,
-                    'minutes_played': 0,
-                    'yellow_cards': 0,
-                    'red_cards': 0
-                }
-                
-                for stat in stats:
-                    name = stat['name'].lower()
-                    value = int(stat['value']) if stat['value'] is not None else 0
-                    
-                    if 'appearances' in name:
-                        player_info['appearances'] = value
-                    elif 'goals' in name and 'own' not in name:
-                        player_info['goals'] = value
-                    elif 'assist' in name:
-                        player_info['assists'] = value
-                    elif 'mins_played' in name:
-                        player_info['minutes_played'] = value
-                    elif 'yellow_cards' in name:
-                        player_info['yellow_cards'] = value
-                    elif 'red_cards' in name:
-                        player_info['red_cards'] = value
-                
-                return player_info
+                return self._parse_player_stats(player, season_id, stats)
             except Exception as e:
                 logger.error(f"선수 {player['player_id']} 정보 오류: {str(e)}")
                 return None
         
-        # 병렬 처리
-        with ThreadPoolExecutor(max_workers=10) as executor:
+        # 병렬 처리 (실제 동시 요청 수는 세션의 적응형 동시성 한도로 제한)
+        with ThreadPoolExecutor(max_workers=self.session.concurrency.maximum) as executor:
             results = list(executor.map(process_player, players))
         
+        self._save_player_stats(results, folder)
+
+    def scrape_matches(self, season_id, folder):
+        """경기 정보 수집 (정수형 변환 추가)"""
+        url = f"{self.base_url}/fixtures"
+        params = {
+            'compSeasons': season_id,
+            'sort': 'asc',
+            'statuses': 'C'
+        }
+        
+        all_matches = []
+        try:
+            # page 0 의 numPages 를 읽고 나머지 페이지는 동시에 요청
+            for fixtures in iter_pages(self.session, url, params, page_size=100):
+                all_matches.extend(self._parse_fixtures(fixtures, season_id))
+        except Exception as e:
+            logger.error(f"경기 페이지 수집 실패: {str(e)}")
+        
+        self._save_matches(all_matches, folder)
+
+    def _save_teams(self, teams, folder):
+        """팀 기본 정보 변환 / 저장"""
+        team_data = []
+        for team in teams:
+            team_data.append({
+                'team_id': int(team['id']),
+                'name': team['name'],
+                'short_name': team.get('shortName', ''),
+                'founded': int(team.get('founded', 0)) if team.get('founded') else None,
+                'stadium': team.get('grounds', [{}])[0].get('name'),
+                'capacity': int(team.get('grounds', [{}])[0].get('capacity', 0)) if team.get('grounds', [{}])[0].get('capacity') else None
+            })
+        
+        df = pd.DataFrame(team_data)
+        
+        # 정수형 컬럼 변환
+        int_columns = ['team_id']
+        df[int_columns] = df[int_columns].astype('int32')
+        
+        # founded와 capacity는 None 값이 있을 수 있으므로 별도 처리
+        if 'founded' in df.columns:
+            df['founded'] = df['founded'].astype('Int32')  # nullable integer
+        if 'capacity' in df.columns:
+            df['capacity'] = df['capacity'].astype('Int32')  # nullable integer
+        
+        df.to_csv(os.path.join(folder, 'teams.csv'), index=False)
+        logger.info(f"{folder} 팀 정보 저장 완료")
+        return team_data
+
+    def _save_team_stats(self, standings, season_id, folder):
+        """팀 시즌 통계 변환 / 저장"""
+        stats_data = []
+        for entry in standings:
+            stats_data.append({
+                'team_id': int(entry['team']['id']),
+                'season_id': int(season_id),
+                'position': int(entry.get('position', 0)),
+                'played': int(entry.get('played', 0)),
+                'wins': int(entry.get('won', 0)),
+                'draws': int(entry.get('drawn', 0)),
+                'losses': int(entry.get('lost', 0)),
+                'goals_for': int(entry.get('goalsFor', 0)),
+                'goals_against': int(entry.get('goalsAgainst', 0)),
+                'points': int(entry.get('points', 0)),
+                'clean_sheets': int(entry.get('cleanSheets', 0)),
+                'goal_difference': int(entry.get('goalDifference', 0))
+            })
+        
+        df = pd.DataFrame(stats_data)
+        
+        # 정수형으로 명시적 변환
+        int_columns = ['team_id', 'season_id', 'position', 'played', 'wins', 
+                      'draws', 'losses', 'goals_for', 'goals_against', 
+                      'points', 'clean_sheets', 'goal_difference']
+        df[int_columns] = df[int_columns].astype('int32')
+        
+        df.to_csv(os.path.join(folder, 'team_stats.csv'), index=False)
+        logger.info(f"{folder} 팀 통계 저장 완료")
+
+    def _parse_players(self, players):
+        return [{
+            'player_id': int(player['id']),
+            'name': player['name']['display'],
+            'position': player.get('info', {}).get('position'),
+            'nationality': player.get('nationalTeam', {}).get('country')
+        } for player in players]
+
+    def _save_players(self, all_players, folder):
+        if all_players:
+            df = pd.DataFrame(all_players)
+            
+            # 정수형 컬럼 변환
+            int_columns = ['player_id']
+            df[int_columns] = df[int_columns].astype('int32')
+            
+            df.to_csv(os.path.join(folder, 'players.csv'), index=False)
+            logger.info(f"{folder} 선수 정보 저장 완료")
+
+    def _parse_player_stats(self, player, season_id, stats):
+        player_info = {
+            'player_id': int(player['player_id']),
+            'season_id': int(season_id),
+            'appearances': 0,
+            'goals': 0,
+            'assists': 0,
+            'minutes_played': 0,
+            'yellow_cards': 0,
+            'red_cards': 0
+        }
+        
+        for stat in stats:
+            name = stat['name'].lower()
+            value = int(stat['value']) if stat['value'] is not None else 0
+            
+            if 'appearances' in name:
+                player_info['appearances'] = value
+            elif 'goals' in name and 'own' not in name:
+                player_info['goals'] = value
+            elif 'assist' in name:
+                player_info['assists'] = value
+            elif 'mins_played' in name:
+                player_info['minutes_played'] = value
+            elif 'yellow_cards' in name:
+                player_info['yellow_cards'] = value
+            elif 'red_cards' in name:
+                player_info['red_cards'] = value
+        
+        return player_info
+
+    def _save_player_stats(self, results, folder):
         valid_results = [r for r in results if r]
         if valid_results:
             df = pd.DataFrame(valid_results)
@@ -299,58 +319,30 @@ class EPLHistoricalScraper:
             df.to_csv(os.path.join(folder, 'player_stats.csv'), index=False)
             logger.info(f"{folder} 선수 통계 저장 완료")
 
-    def scrape_matches(self, season_id, folder):
-        """경기 정보 수집 (정수형 변환 추가)"""
-        url = f"{self.base_url}/fixtures"
-        params = {
-            'compSeasons': season_id,
-            'pageSize': 100,
-            'page': 0,
-            'sort': 'asc',
-            'statuses': 'C'
-        }
-        
+    def _parse_fixtures(self, fixtures, season_id):
         all_matches = []
-        while True:
-            try:
-                response = self.session.get(url, params=params, headers=self.headers)
-                response.raise_for_status()
-                data = response.json()
-                fixtures = data.get('content', [])
-                
-                if not fixtures:
-                    break
-                
-                for fixture in fixtures:
-                    teams = fixture.get('teams', [])
-                    home_team_id = teams[0].get('team', {}).get('id', 0) if len(teams) > 0 else 0
-                    away_team_id = teams[1].get('team', {}).get('id', 0) if len(teams) > 1 else 0
-                    home_score = teams[0].get('score', 0) if len(teams) > 0 else 0
-                    away_score = teams[1].get('score', 0) if len(teams) > 1 else 0
-                    
-                    all_matches.append({
-                        'match_id': int(fixture['id']),
-                        'season_id': int(season_id),
-                        'date': fixture.get('kickoff', {}).get('label'),
-                        'home_team': int(home_team_id),
-                        'away_team': int(away_team_id),
-                        'home_score': int(home_score) if home_score is not None else 0,
-                        'away_score': int(away_score) if away_score is not None else 0,
-                        'status': fixture.get('status'),
-                        'stadium': fixture.get('ground', {}).get('name'),
-                        'attendance': int(fixture.get('attendance', 0)) if fixture.get('attendance') else None
-                    })
-                
-                if params['page'] >= data.get('pageInfo', {}).get('numPages', 0) - 1:
-                    break
-                    
-                params['page'] += 1
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"경기 페이지 {params['page']} 수집 실패: {str(e)}")
-                break
-        
+        for fixture in fixtures:
+            teams = fixture.get('teams', [])
+            home_team_id = teams[0].get('team', {}).get('id', 0) if len(teams) > 0 else 0
+            away_team_id = teams[1].get('team', {}).get('id', 0) if len(teams) > 1 else 0
+            home_score = teams[0].get('score', 0) if len(teams) > 0 else 0
+            away_score = teams[1].get('score', 0) if len(teams) > 1 else 0
+            
+            all_matches.append({
+                'match_id': int(fixture['id']),
+                'season_id': int(season_id),
+                'date': fixture.get('kickoff', {}).get('label'),
+                'home_team': int(home_team_id),
+                'away_team': int(away_team_id),
+                'home_score': int(home_score) if home_score is not None else 0,
+                'away_score': int(away_score) if away_score is not None else 0,
+                'status': fixture.get('status'),
+                'stadium': fixture.get('ground', {}).get('name'),
+                'attendance': int(fixture.get('attendance', 0)) if fixture.get('attendance') else None
+            })
+        return all_matches
+
+    def _save_matches(self, all_matches, folder):
         if all_matches:
             df = pd.DataFrame(all_matches)
             
@@ -379,8 +371,88 @@ class EPLHistoricalScraper:
             self.process_season(season)
             elapsed = time.time() - start_time
             logger.info(f"{season['label']} 시즌 처리 완료 (소요시간: {elapsed:.2f}초)")
-            time.sleep(5)  # API 부하 방지
+        self.log_cache_summary()
+
+    def log_cache_summary(self):
+        if self.cache is not None:
+            logger.info(f"응답 캐시: {self.cache.summary()}")
+
+    async def process_season_async(self, client, season):
+        """단일 시즌 비동기 처리: 팀 / 순위 / 선수 / 경기 목록을 동시에 받고, 선수 통계도 동시에 수집"""
+        season_id = season['id']
+        season_label = season['label'].replace('/', '_')
+        season_folder = os.path.join(self.output_folder, season_label)
+        os.makedirs(season_folder, exist_ok=True)
+        logger.info(f"시즌 처리 시작: {season_label} ({season_id}) [async]")
+
+        teams, standings, players, fixtures = await asyncio.gather(
+            client.teams(season_id),
+            client.standings(season_id),
+            client.players(season_id, altIds='true'),
+            client.fixtures(season_id, statuses='C'),
+            return_exceptions=True
+        )
+
+        if isinstance(teams, Exception):
+            logger.error(f"팀 정보 수집 실패: {str(teams)}")
+        elif teams:
+            self._save_teams(teams, season_folder)
+            if isinstance(standings, Exception):
+                logger.error(f"팀 통계 수집 실패: {str(standings)}")
+            else:
+                self._save_team_stats(standings.get('tables', [{}])[0].get('entries', []), season_id, season_folder)
+
+        if isinstance(players, Exception):
+            logger.error(f"선수 정보 수집 실패: {str(players)}")
+        else:
+            all_players = self._parse_players(players)
+            self._save_players(all_players, season_folder)
+
+            async def process_player(player):
+                try:
+                    data = await client.player_stats(player['player_id'], season_id)
+                    return self._parse_player_stats(player, season_id, data.get('stats', []))
+                except Exception as e:
+                    logger.error(f"선수 {player['player_id']} 정보 오류: {str(e)}")
+                    return None
+
+            if all_players:
+                self._save_player_stats(await asyncio.gather(*(process_player(p) for p in all_players)), season_folder)
+
+        if isinstance(fixtures, Exception):
+            logger.error(f"경기 정보 수집 실패: {str(fixtures)}")
+        else:
+            self._save_matches(self._parse_fixtures(fixtures, season_id), season_folder)
+
+    async def _run_async(self, seasons, max_connections):
+        async with AsyncPulseliveClient(self.base_url, max_connections=max_connections, backoff_factor=1,
+                                        cache=self.cache) as client:
+            for season in seasons:
+                start_time = time.time()
+                await self.process_season_async(client, season)
+                elapsed = time.time() - start_time
+                logger.info(f"{season['label']} 시즌 처리 완료 (소요시간: {elapsed:.2f}초)")
+
+    def run_async(self, max_connections=10):
+        """asyncio 실행 모드"""
+        seasons = self.get_all_seasons()
+        if not seasons:
+            logger.error("시즌 정보를 찾을 수 없습니다.")
+            return
+        
+        logger.info(f"총 {len(seasons)}개 시즌 처리 시작 (async)")
+        asyncio.run(self._run_async(seasons, max_connections))
+        self.log_cache_summary()
 
 if __name__ == "__main__":
-    scraper = EPLHistoricalScraper()
-    scraper.run()
+    parser = argparse.ArgumentParser(description="EPL 시즌별 과거 데이터 수집")
+    parser.add_argument('--async', dest='use_async', action='store_true', help="asyncio 클라이언트로 실행")
+    parser.add_argument('--base-url', default=PULSELIVE_BASE_URL)
+    parser.add_argument('--no-cache', action='store_true', help="응답 캐시를 사용하지 않음")
+    args = parser.parse_args()
+
+    scraper = EPLHistoricalScraper(base_url=args.base_url, use_cache=not args.no_cache)
+    if args.use_async:
+        scraper.run_async()
+    else:
+        scraper.run()
@@ -0,0 +1,57 @@
+import csv
+import threading
+import time
+
+import numpy as np
+
+
+class PageTimings:
+    """
+    Selenium 페이지별 로드 / 추출 시간 기록.
+    load 는 driver.get() 반환까지, extract 는 필요한 선택자 대기 + DOM 읽기 시간이며
+    summary() 로 분당 처리 페이지 수를 비교할 수 있습니다.
+    """
+
+    def __init__(self):
+        self.rows = []
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+
+    def record(self, kind, url, load_seconds, extract_seconds, ok=True):
+        with self.lock:
+            self.rows.append({
+                'kind': kind,
+                'url': url,
+                'load_s': round(load_seconds, 3),
+                'extract_s': round(extract_seconds, 3),
+                'ok': ok,
+                'finished_at': round(time.perf_counter() - self.started, 3)
+            })
+
+    def summary(self):
+        with self.lock:
+            rows = list(self.rows)
+        if not rows:
+            return {}
+        load = np.array([r['load_s'] for r in rows])
+        extract = np.array([r['extract_s'] for r in rows])
+        elapsed = max(r['finished_at'] for r in rows)
+        return {
+            'pages': len(rows),
+            'failed': sum(not r['ok'] for r in rows),
+            'pages_per_minute': round(len(rows) / elapsed * 60, 1) if elapsed > 0 else None,
+            'load_mean_s': round(float(load.mean()), 3),
+            'load_p95_s': round(float(np.percentile(load, 95)), 3),
+            'extract_mean_s': round(float(extract.mean()), 3),
+            'extract_p95_s': round(float(np.percentile(extract, 95)), 3)
+        }
+
+    def save_csv(self, path):
+        with self.lock:
+            rows = list(self.rows)
+        if not rows:
+            return
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
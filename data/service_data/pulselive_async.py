@@ -0,0 +1,125 @@
+import asyncio
+import json
+import logging
+
+import aiohttp
+
+from pulselive_http import PULSELIVE_HEADERS, RETRY_STATUSES, get_shared_limiter, parse_retry_after
+
+logger = logging.getLogger()
+
+PULSELIVE_BASE_URL = "https://footballapi.pulselive.com/football"
+
+
+class AsyncPulseliveClient:
+    """
+    footballapi.pulselive.com asyncio 클라이언트 (fixtures / players / stats/player / teams / standings).
+    하나의 aiohttp 세션으로 연결을 재사용하고, 5xx / 연결 오류는 기존 Retry 설정과 같은 지수 백오프로 재시도합니다.
+    요청 속도는 동기 세션과 같은 프로세스 공용 토큰 버킷(TokenBucketLimiter)으로 제한되며 429 는 Retry-After 를 따릅니다.
+    cache(ResponseCache) 가 주어지면 동기 세션과 같은 응답 캐시를 먼저 조회합니다.
+
+        async with AsyncPulseliveClient() as client:
+            fixtures = await client.fixtures(719)
+    """
+
+    def __init__(self, base_url=PULSELIVE_BASE_URL, max_connections=10, retries=5, backoff_factor=0.5,
+                 limiter=None, timeout=10, cache=None):
+        self.base_url = base_url
+        self.max_connections = max_connections
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.limiter = limiter or get_shared_limiter()
+        self.timeout = timeout
+        self.cache = cache
+        self.session = None
+
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_connections),
+            headers=PULSELIVE_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+
+    async def _wait_for_slot(self, url):
+        await asyncio.sleep(self.limiter.reserve(url))
+        blocked = self.limiter.blocked_for(url)
+        if blocked > 0:
+            await asyncio.sleep(blocked)
+
+    async def get_json(self, path, params=None):
+        url = f"{self.base_url}{path}"
+        params = {key: str(value) for key, value in (params or {}).items()}
+        if self.cache is not None:
+            body = self.cache.get(url, params)
+            if body is not None:
+                return json.loads(body)
+
+        for attempt in range(self.retries + 1):
+            await self._wait_for_slot(url)
+            try:
+                async with self.session.get(url, params=params) as response:
+                    if response.status == 429:
+                        self.limiter.on_throttled(url, parse_retry_after(response.headers.get('Retry-After'), 2.0 ** attempt))
+                        continue
+                    if response.status in RETRY_STATUSES and attempt < self.retries:
+                        await asyncio.sleep(self.backoff_factor * 2 ** attempt)
+                        continue
+                    response.raise_for_status()
+                    self.limiter.on_success(url)
+                    body = await response.read()
+                    if self.cache is not None:
+                        self.cache.put(url, params, body)
+                    return json.loads(body)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self.retries:
+                    raise
+                await asyncio.sleep(self.backoff_factor * 2 ** attempt)
+        raise aiohttp.ClientError(f"요청 재시도 횟수 초과: {url}")
+
+    async def iter_pages(self, path, params, page_size=100):
+        """
+        page 순서대로 content 를 내보내는 비동기 스트리밍 페이지네이터.
+        page=0 의 pageInfo.numPages 를 읽은 뒤 나머지 페이지를 동시에 요청합니다 (속도는 토큰 버킷이 제한).
+        """
+        first = await self.get_json(path, {**params, 'pageSize': page_size, 'page': 0})
+        yield first.get('content', [])
+        num_pages = first.get('pageInfo', {}).get('numPages', 0)
+        tasks = [
+            asyncio.ensure_future(self.get_json(path, {**params, 'pageSize': page_size, 'page': page}))
+            for page in range(1, num_pages)
+        ]
+        try:
+            for task in tasks:
+                yield (await task).get('content', [])
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_all_pages(self, path, params, page_size=100):
+        """모든 페이지의 content 를 순서대로 합쳐서 반환"""
+        items = []
+        async for content in self.iter_pages(path, params, page_size):
+            items.extend(content)
+        return items
+
+    async def fixtures(self, season_id, **params):
+        return await self.get_all_pages("/fixtures", {'compSeasons': season_id, 'sort': 'asc', **params})
+
+    async def players(self, season_id, team_id=None, page_size=100, **params):
+        if team_id is not None:
+            params['teams'] = int(team_id)
+        return await self.get_all_pages("/players", {'compSeasons': season_id, **params}, page_size=page_size)
+
+    async def player_stats(self, player_id, season_id, comps=1):
+        return await self.get_json(f"/stats/player/{int(player_id)}", {'compSeasons': season_id, 'comps': comps})
+
+    async def teams(self, season_id, comps=1):
+        data = await self.get_json("/teams", {'compSeasons': season_id, 'comps': comps, 'pageSize': 30, 'altIds': 'true'})
+        return data.get('content', [])
+
+    async def standings(self, season_id):
+        return await self.get_json("/standings", {'compSeasons': season_id, 'altIds': 'true'})
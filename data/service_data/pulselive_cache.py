@@ -0,0 +1,112 @@
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+# 종료된 프리미어리그 시즌 (pulselive compSeason id, 2010/11 ~ 2023/24). 이 시즌 응답만 만료 없이 캐시하며,
+# 목록에 없는 시즌(진행 중 / 새 시즌 / 알 수 없는 id)은 current_ttl 로만 캐시. 시즌이 끝나면 여기에 추가
+COMPLETED_SEASON_IDS = {19, 20, 21, 22, 27, 42, 54, 79, 210, 274, 363, 418, 489, 578}
+
+# 시즌과 무관한 엔드포인트별 TTL (초, 경로 접두사 기준)
+ENDPOINT_TTLS = {
+    '/competitions': 86400,
+}
+
+
+class ResponseCache:
+    """
+    pulselive API 응답 캐시 (SQLite).
+    정규화된 URL + 쿼리 파라미터를 키로 200 응답 본문을 저장하며, TTL 은 요청한 시즌에 따라 정해집니다.
+    - 요청한 시즌이 모두 completed_season_ids 에 있으면 만료되지 않음
+    - 그 밖의 시즌(진행 중 / 아직 목록에 없는 시즌)은 current_ttl 초 후 만료
+    - 시즌이 없는 요청은 ENDPOINT_TTLS 또는 default_ttl
+    """
+
+    def __init__(self, path="pulselive_cache.sqlite", completed_season_ids=COMPLETED_SEASON_IDS, current_ttl=600,
+                 default_ttl=3600, endpoint_ttls=ENDPOINT_TTLS):
+        self.path = path
+        self.completed_season_ids = {str(int(season_id)) for season_id in completed_season_ids}
+        self.current_ttl = current_ttl
+        self.default_ttl = default_ttl
+        self.endpoint_ttls = endpoint_ttls
+        self.stats = {'hits': 0, 'misses': 0, 'expired': 0, 'stored': 0}
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body BLOB,
+                fetched_at REAL,
+                expires_at REAL
+            );
+        """)
+
+    @staticmethod
+    def normalize(url, params=None):
+        """URL 쿼리와 params 를 합쳐 키 정렬한 정규 URL -> (키, 경로, 파라미터 dict)"""
+        parsed = urlparse(url)
+        query = dict(parse_qsl(parsed.query))
+        query.update({key: str(value) for key, value in (params or {}).items() if value is not None})
+        key = f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{urlencode(sorted(query.items()))}"
+        return key, parsed.path, query
+
+    def ttl_for(self, path, query):
+        """None 이면 만료되지 않음"""
+        seasons = {season.strip() for season in query.get('compSeasons', '').split(',')} - {''}
+        if seasons:
+            return None if seasons <= self.completed_season_ids else self.current_ttl
+        for prefix, ttl in self.endpoint_ttls.items():
+            if prefix in path:
+                return ttl
+        return self.default_ttl
+
+    def get(self, url, params=None):
+        key, _, _ = self.normalize(url, params)
+        with self.lock:
+            row = self.conn.execute("SELECT body, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            body, expires_at = row
+            if expires_at is not None and expires_at < time.time():
+                self.stats['expired'] += 1
+                return None
+            self.stats['hits'] += 1
+            return body
+
+    def put(self, url, params, body):
+        key, path, query = self.normalize(url, params)
+        ttl = self.ttl_for(path, query)
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, fetched_at, expires_at) VALUES (?, ?, ?, ?)",
+                (key, body, now, None if ttl is None else now + ttl)
+            )
+            self.conn.commit()
+            self.stats['stored'] += 1
+
+    def purge_expired(self):
+        with self.lock:
+            deleted = self.conn.execute("DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at < ?",
+                                        (time.time(),)).rowcount
+            self.conn.commit()
+        return deleted
+
+    def summary(self):
+        lookups = self.stats['hits'] + self.stats['misses'] + self.stats['expired']
+        hit_rate = self.stats['hits'] / lookups if lookups else 0.0
+        return {**self.stats, 'hit_rate': round(hit_rate, 3)}
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache(path="pulselive_cache.sqlite"):
+    """프로세스 공용 응답 캐시 (keyplayer / tablewise_scrapper 의 동기 / 비동기 클라이언트가 함께 사용)"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResponseCache(path)
+        return _shared_cache
@@ -0,0 +1,250 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger()
+
+PULSELIVE_HEADERS = {
+    'Origin': 'https://www.premierleague.com',
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36',
+    'Accept': 'application/json'
+}
+RETRY_STATUSES = {500, 502, 503, 504}
+
+
+def parse_retry_after(value, default):
+    """Retry-After 헤더 (초 또는 HTTP 날짜) -> 대기 초"""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+class TokenBucketLimiter:
+    """
+    호스트별 토큰 버킷 요청 속도 제한기 (프로세스 내 모든 워커 공유).
+    초당 rate 개 요청, 최대 burst 개까지 연속 허용하며 reserve() 는 기다려야 할 시간만 계산하므로
+    스레드(acquire)와 asyncio(await asyncio.sleep(reserve(...))) 양쪽에서 사용할 수 있습니다.
+    429 응답을 받으면 Retry-After 동안 해당 호스트를 멈추고 속도를 절반으로 낮춘 뒤, 성공할 때마다 조금씩 회복합니다.
+    """
+
+    def __init__(self, rate=5.0, burst=5, min_rate=0.5):
+        self.target_rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+    def _host(self, url):
+        host = urlparse(url).netloc
+        state = self.hosts.get(host)
+        if state is None:
+            state = self.hosts[host] = {'rate': self.target_rate, 'tat': 0.0, 'blocked_until': 0.0}
+        return host, state
+
+    def reserve(self, url):
+        """요청 하나의 자리를 예약하고 대기해야 할 초를 반환 (GCRA 방식 토큰 버킷)"""
+        with self.lock:
+            _, state = self._host(url)
+            now = time.monotonic()
+            interval = 1.0 / state['rate']
+            tat = max(state['tat'], now, state['blocked_until'])
+            delay = max(0.0, tat - (self.burst - 1) * interval - now, state['blocked_until'] - now)
+            state['tat'] = tat + interval
+            return delay
+
+    def blocked_for(self, url):
+        """429 로 차단된 남은 시간 (초)"""
+        with self.lock:
+            _, state = self._host(url)
+            return max(0.0, state['blocked_until'] - time.monotonic())
+
+    def acquire(self, url):
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        # 대기하는 동안 다른 워커가 429 를 받았다면 차단이 풀릴 때까지 추가로 대기
+        blocked = self.blocked_for(url)
+        if blocked > 0:
+            time.sleep(blocked)
+
+    def on_throttled(self, url, retry_after):
+        with self.lock:
+            host, state = self._host(url)
+            state['blocked_until'] = max(state['blocked_until'], time.monotonic() + retry_after)
+            state['rate'] = max(self.min_rate, state['rate'] / 2)
+            rate = state['rate']
+        logger.warning(f"429 응답: {host} {retry_after:.1f}초 대기, 요청 속도 {rate:.2f}/s 로 감소")
+
+    def on_success(self, url):
+        with self.lock:
+            _, state = self._host(url)
+            if state['rate'] < self.target_rate:
+                state['rate'] = min(self.target_rate, state['rate'] + self.target_rate * 0.05)
+
+
+class AdaptiveConcurrency:
+    """
+    관측 지연 시간 기반 동시 요청 수 조절 (AIMD).
+    지연이 target_latency 이하이면 한도를 천천히 늘리고, 초과하거나 429 를 받으면 25% 줄입니다.
+    스레드 풀은 maximum 개 워커로 만들고, 실제 동시 요청 수는 이 한도로 제한됩니다.
+    """
+
+    def __init__(self, initial=5, minimum=1, maximum=16, target_latency=1.0):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.in_flight = 0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self, latency, throttled=False):
+        with self.condition:
+            self.in_flight -= 1
+            if throttled or latency > self.target_latency:
+                self.limit = max(self.minimum, self.limit * 0.75)
+            else:
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            self.condition.notify_all()
+
+
+class PulseliveSession(requests.Session):
+    """
+    공유 속도 제한기 / 동시성 조절기를 거쳐 요청하는 requests 세션.
+    429 / 5xx / 연결 오류 재시도를 urllib3 Retry 대신 여기서 처리하여 재시도마다 토큰과 동시성 자리를 새로 받고,
+    Retry-After 는 모든 워커가 함께 따르도록 합니다.
+    cache(ResponseCache) 가 주어지면 GET 응답을 캐시에서 먼저 찾고, 캐시 적중 시 네트워크 / 속도 제한을 거치지 않습니다.
+    """
+
+    def __init__(self, limiter, concurrency=None, backoff_factor=0.5, retries=5, max_throttle_retries=5, cache=None):
+        super().__init__()
+        self.limiter = limiter
+        self.concurrency = concurrency
+        self.cache = cache
+        self.backoff_factor = backoff_factor
+        self.retries = retries
+        self.max_throttle_retries = max_throttle_retries
+        # 어댑터 자체는 재시도하지 않음 (재시도가 속도 제한기를 우회하지 않도록)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=concurrency.maximum if concurrency else 10)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        self.headers.update(PULSELIVE_HEADERS)
+
+    def _cached_response(self, url, body):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response.url = url
+        response.encoding = 'utf-8'
+        response.headers['Content-Type'] = 'application/json'
+        response.from_cache = True
+        return response
+
+    def request(self, method, url, *args, **kwargs):
+        use_cache = self.cache is not None and method.upper() == 'GET' and not args
+        if use_cache:
+            body = self.cache.get(url, kwargs.get('params'))
+            if body is not None:
+                return self._cached_response(url, body)
+
+        retryable = method.upper() == 'GET'
+        retries = throttles = 0
+        while True:
+            self.limiter.acquire(url)
+            if self.concurrency:
+                self.concurrency.acquire()
+            started = time.perf_counter()
+            throttled = False
+            try:
+                response = super().request(method, url, *args, **kwargs)
+                throttled = response.status_code == 429
+            except (requests.ConnectionError, requests.Timeout):
+                if not retryable or retries >= self.retries:
+                    raise
+                response = None
+            finally:
+                if self.concurrency:
+                    self.concurrency.release(time.perf_counter() - started, throttled)
+
+            if throttled:
+                self.limiter.on_throttled(url, parse_retry_after(response.headers.get('Retry-After'), 2.0 ** throttles))
+                if throttles >= self.max_throttle_retries:
+                    return response
+                throttles += 1
+                continue
+            if response is None or (retryable and response.status_code in RETRY_STATUSES and retries < self.retries):
+                time.sleep(self.backoff_factor * 2 ** retries)
+                retries += 1
+                continue
+
+            self.limiter.on_success(url)
+            if use_cache and response.status_code == 200:
+                self.cache.put(url, kwargs.get('params'), response.content)
+            return response
+
+
+_shared_limiter = TokenBucketLimiter()
+_shared_concurrency = AdaptiveConcurrency()
+
+
+def get_shared_limiter():
+    return _shared_limiter
+
+
+def create_pulselive_session(backoff_factor=0.5, cache=None):
+    """프로세스 공용 속도 제한기 / 동시성 조절기를 사용하는 pulselive API 세션 (cache: ResponseCache, 선택)"""
+    return PulseliveSession(_shared_limiter, _shared_concurrency, backoff_factor=backoff_factor, cache=cache)
+
+
+def iter_pages(session, url, params, page_size=100, max_workers=8, timeout=10):
+    """
+    페이지 단위 content 를 page 순서대로 내보내는 스트리밍 페이지네이터.
+    page=0 응답의 pageInfo.numPages 를 읽은 뒤 나머지 페이지는 동시에 요청하며(속도는 세션의 토큰 버킷이 제한),
+    앞 페이지가 도착하는 대로 바로 처리할 수 있습니다.
+    """
+    def fetch(page):
+        response = session.get(url, params={**params, 'pageSize': page_size, 'page': page}, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    first = fetch(0)
+    yield first.get('content', [])
+    num_pages = first.get('pageInfo', {}).get('numPages', 0)
+    if num_pages <= 1:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, num_pages - 1)) as executor:
+        futures = [executor.submit(fetch, page) for page in range(1, num_pages)]
+        try:
+            for future in futures:
+                yield future.result().get('content', [])
+        finally:
+            # 호출 측이 중간에 멈추면 아직 시작하지 않은 요청은 취소
+            for future in futures:
+                future.cancel()
+
+
+def fetch_all_pages(session, url, params, page_size=100, max_workers=8, timeout=10):
+    """모든 페이지의 content 를 순서대로 합쳐서 반환"""
+    items = []
+    for content in iter_pages(session, url, params, page_size, max_workers, timeout):
+        items.extend(content)
+    return items
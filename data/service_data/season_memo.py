@@ -0,0 +1,74 @@
+import json
+import os
+import threading
+import time
+import logging
+
+logger = logging.getLogger()
+
+
+class SeasonMemo:
+    """
+    (시즌, 종류, id) 단위 API 결과 메모이제이션.
+    같은 키를 여러 워커가 동시에 요청해도 fetch 는 한 번만 실행되며(키별 잠금),
+    예외가 발생한 결과는 저장하지 않습니다. path 가 주어지면 JSON 파일로 저장 / 복원하고,
+    max_age(초) 보다 오래된 항목은 불러오지 않습니다.
+    """
+
+    def __init__(self, path=None, max_age=None):
+        self.path = path
+        self.max_age = max_age
+        self.entries = {}
+        self.stats = {'hits': 0, 'misses': 0}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        if path and os.path.exists(path):
+            self.load()
+
+    @staticmethod
+    def make_key(kind, season_id, item_id):
+        return f"{kind}|{int(season_id)}|{int(item_id)}"
+
+    def get_or_fetch(self, kind, season_id, item_id, fetch):
+        key = self.make_key(kind, season_id, item_id)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                with self._lock:
+                    self.stats['hits'] += 1
+                return entry['value']
+            value = fetch()
+            with self._lock:
+                self.entries[key] = {'value': value, 'fetched_at': time.time()}
+                self.stats['misses'] += 1
+            return value
+
+    def contains(self, kind, season_id, item_id):
+        return self.make_key(kind, season_id, item_id) in self.entries
+
+    def put(self, kind, season_id, item_id, value):
+        """비동기 경로 등 외부에서 미리 받아온 결과 저장"""
+        with self._lock:
+            self.entries[self.make_key(kind, season_id, item_id)] = {'value': value, 'fetched_at': time.time()}
+            self.stats['misses'] += 1
+
+    def load(self):
+        with open(self.path, encoding='utf-8') as f:
+            entries = json.load(f)
+        if self.max_age is not None:
+            cutoff = time.time() - self.max_age
+            entries = {key: entry for key, entry in entries.items() if entry['fetched_at'] >= cutoff}
+        self.entries = entries
+        logger.info(f"메모 캐시 로드: {len(entries)}개 항목 ({self.path})")
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            entries = dict(self.entries)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
@@ -1,17 +1,21 @@
+import argparse
 import time
-import os
-import tempfile
 import re
 import csv
-from selenium import webdriver
+import queue
+import threading
+from urllib.parse import urlparse
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 
-def get_player_list(driver, team_squad_url):
+from crawl_checkpoint import CrawlCheckpoint
+from driver_manager import get_driver_manager
+from fotmob_http import create_session, fetch_player_details
+from page_timing import PageTimings
+
+def get_player_list(driver, team_squad_url, timings=None):
     """
     팀 스쿼드 페이지에서 감독을 제외한 모든 선수의 이름과 상대 URL을 추출합니다.
     """
@@ -19,7 +23,9 @@ def get_player_list(driver, team_squad_url):
     player_info_list = []
     
     print(f"\n'{team_squad_url}' 접속: 선수 목록 수집 시작...")
+    started = time.perf_counter()
     driver.get(team_squad_url)
+    loaded = time.perf_counter()
 
     squad_table_selector = "table[class*='Squad']"
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, squad_table_selector)))
@@ -35,20 +41,26 @@ def get_player_list(driver, team_squad_url):
         except (NoSuchElementException, StaleElementReferenceException):
             continue
     
+    if timings:
+        timings.record('squad', team_squad_url, loaded - started, time.perf_counter() - loaded)
     if player_info_list:
         print(f"'{player_info_list[0]['name']}' 감독 제외.")
         return player_info_list[1:]
     return []
 
-def get_player_details(driver, player_url):
+def get_player_details(driver, player_url, timings=None):
     """
     선수 개인 페이지에서 공통 정보, 주 포지션, 시즌 성적을 모두 추출합니다.
     StaleElementReferenceException에 대한 재시도 로직을 포함합니다.
+    eager 페이지 로드에서도 동작하도록 필요한 컨테이너가 나타날 때까지만 기다립니다.
     """
     details = {}
     for attempt in range(3): # 최대 3번 재시도
         try:
+            started = time.perf_counter()
+            loaded = None
             driver.get(player_url)
+            loaded = time.perf_counter()
             wait = WebDriverWait(driver, 10)
             
             # 1. 바이오 정보 추출
@@ -75,7 +87,7 @@ def get_player_details(driver, player_url):
 
             # 3. 시즌 성적 추출
             season_stats = {}
-            stats_container = driver.find_element(By.CSS_SELECTOR, "div[class*='StatsContainer']")
+            stats_container = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='StatsContainer']")))
             stat_boxes = stats_container.find_elements(By.CSS_SELECTOR, "div[class*='StatBox']")
             for box in stat_boxes:
                 try:
@@ -86,6 +98,8 @@ def get_player_details(driver, player_url):
                     continue
             details['season_stats'] = season_stats
             
+            if timings:
+                timings.record('player', player_url, loaded - started, time.perf_counter() - loaded)
             return details # 성공 시 즉시 반환
 
         except StaleElementReferenceException:
@@ -93,6 +107,10 @@ def get_player_details(driver, player_url):
             time.sleep(2)
         except TimeoutException:
             print(f"  - 페이지 로딩 시간 초과. 다음 선수로 넘어갑니다.")
+            if timings:
+                now = time.perf_counter()
+                # driver.get() 자체가 시간 초과된 경우 전체 시간을 로드 시간으로 기록
+                timings.record('player', player_url, (loaded or now) - started, now - (loaded or now), ok=False)
             return {}
         except Exception as e:
             print(f"  - 상세 정보 수집 중 알 수 없는 오류: {e}")
@@ -127,6 +145,142 @@ def save_to_csv(data_list, filename):
         print(f"CSV 저장 중 오류 발생: {e}")
 
 
+class DomainRateLimiter:
+    """
+    여러 브라우저 워커가 공유하는 도메인별 요청 속도 제한기.
+    고정 sleep 대신 도메인마다 다음 요청 가능 시각을 예약하여 초당 requests_per_second 이하로 맞춥니다.
+    """
+    def __init__(self, requests_per_second=1.0):
+        self.interval = 1.0 / requests_per_second
+        self.next_slot = {}
+        self.lock = threading.Lock()
+
+    def wait(self, url):
+        domain = urlparse(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(domain, now))
+            self.next_slot[domain] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+def build_player_record(player, details):
+    """기본 정보와 상세 정보를 결합"""
+    player_full_data = player.copy()
+    player_full_data['primary_position'] = details.get('primary_position')
+    player_full_data['height'] = details.get('height')
+    player_full_data['shirt'] = details.get('shirt')
+    player_full_data['preferred_foot'] = details.get('preferred_foot')
+    player_full_data['market_value'] = details.get('market_value')
+    
+    # 시즌 스탯 추가
+    if 'season_stats' in details:
+        player_full_data.update(details['season_stats'])
+    return player_full_data
+
+def crawl_teams(team_urls, num_workers=4, requests_per_second=1.0, checkpoint=None, max_pages_per_browser=200,
+                lightweight=True, timings=None, extraction='http'):
+    """
+    N개의 브라우저 워커가 공유 작업 큐에서 스쿼드 / 선수 페이지를 가져가 처리합니다.
+    스쿼드 페이지에서 찾은 선수는 같은 큐에 추가되며, 결과는 (골키퍼, 필드 플레이어) 목록으로 병합됩니다.
+    checkpoint(CrawlCheckpoint) 가 주어지면 선수마다 기록을 추가 저장하고, 이미 수집한 팀 목록 / 선수는 건너뜁니다.
+    timings(PageTimings) 가 주어지면 페이지별 로드 / 추출 시간을 기록합니다.
+    extraction='http' 이면 선수 페이지를 HTTP 로 받아 내장 JSON 을 파싱하고, 실패한 경우에만 브라우저로 렌더링합니다.
+    """
+    tasks = queue.Queue()
+    results = checkpoint.results() if checkpoint else []
+    results_lock = threading.Lock()
+    
+    def enqueue_players(players, order):
+        for player_index, found in enumerate(players):
+            if checkpoint and checkpoint.is_done(found['url']):
+                continue
+            tasks.put(('player', found['url'], order + (player_index,), found))
+    
+    for team_index, team_url in enumerate(team_urls):
+        listed = checkpoint.team_players(team_url) if checkpoint else None
+        if listed is not None:
+            enqueue_players(listed, (team_index,))
+        else:
+            tasks.put(('team', team_url, (team_index,), None))
+    print(f"남은 작업: {tasks.qsize()}개 (완료된 선수 {len(results)}명)")
+    
+    rate_limiter = DomainRateLimiter(requests_per_second)
+    
+    # 공용 드라이버 풀(get_url 등과 공유)을 워커 수만큼 늘려 빌려 쓰며 N 페이지마다 / 크래시 시 교체
+    manager = get_driver_manager(size=num_workers, max_pages=max_pages_per_browser, lightweight=lightweight)
+    # HTTP 모드에서는 스쿼드 페이지 / 대체 경로에만 브라우저가 필요하므로 하나만 미리 띄움
+    manager.warm(1 if extraction == 'http' else None)
+    session = create_session(pool_size=num_workers) if extraction == 'http' else None
+    fallback_count = [0]
+    
+    def worker(worker_id):
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            kind, url, order, player = task
+            try:
+                rate_limiter.wait(url)
+                details = None
+                if kind == 'player':
+                    print(f"[worker {worker_id}] {player['name']} 선수 데이터 처리 중...")
+                    if session is not None:
+                        details = fetch_player_details(session, url, timings)
+                        if details is None:
+                            print("  - 내장 데이터 파싱 실패, 브라우저로 재시도합니다.")
+                            with results_lock:
+                                fallback_count[0] += 1
+                            rate_limiter.wait(url)
+                if kind == 'team' or details is None:
+                    with manager.driver() as driver:
+                        if kind == 'team':
+                            players = get_player_list(driver, url, timings)
+                        else:
+                            details = get_player_details(driver, url, timings)
+                if kind == 'team':
+                    if not players:
+                        print(f"'{url}'에서 선수 정보를 찾지 못해 다음 팀으로 넘어갑니다.")
+                    elif checkpoint:
+                        checkpoint.mark_team(url, players)
+                    enqueue_players(players, order)
+                elif details:
+                    record = build_player_record(player, details)
+                    if checkpoint:
+                        checkpoint.append(order, url, record)
+                    with results_lock:
+                        results.append((order, record))
+            except Exception as e:
+                print(f"[worker {worker_id}] 작업 처리 중 오류 ({url}): {e}")
+            finally:
+                tasks.task_done()
+    
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(num_workers)]
+    for thread in threads:
+        thread.start()
+    tasks.join()
+    for _ in threads:
+        tasks.put(None)
+    for thread in threads:
+        thread.join()
+    # 공용 풀의 브라우저는 다른 호출에서 재사용하고 프로세스 종료 시 정리
+    print(f"브라우저 통계: {manager.stats}")
+    if session is not None:
+        print(f"브라우저 대체 경로 사용: {fallback_count[0]}회")
+    if checkpoint:
+        checkpoint.finish()
+    
+    # 팀 / 선수 순서대로 정렬 후 주 포지션(primary_position)을 기준으로 GK 여부 판단
+    all_goalkeepers_data = []
+    all_outfield_players_data = []
+    for _, record in sorted(results, key=lambda r: r[0]):
+        if record.get('primary_position') == 'GK':
+            all_goalkeepers_data.append(record)
+        else:
+            all_outfield_players_data.append(record)
+    return all_goalkeepers_data, all_outfield_players_data
+
+
 # --- 메인 스크립트 실행 부분 ---
 if __name__ == "__main__":
     team_urls = [
@@ -152,61 +306,28 @@ if __name__ == "__main__":
         "https://www.fotmob.com/en-GB/teams/8466/squad/southampton"
     ]
     
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless=new')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    user_data_dir = os.path.join(tempfile.gettempdir(), f'selenium_chrome_profile_{os.getpid()}')
-    options.add_argument(f'--user-data-dir={user_data_dir}')
-    
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    base_url = "https://www.fotmob.com"
+    parser = argparse.ArgumentParser(description="fotmob 선수 상세 스탯 크롤러")
+    parser.add_argument('--workers', type=int, default=4, help="동시에 실행할 브라우저 수")
+    parser.add_argument('--rps', type=float, default=1.0, help="fotmob 도메인 전체 초당 요청 수")
+    parser.add_argument('--restart', action='store_true', help="체크포인트를 지우고 처음부터 수집")
+    parser.add_argument('--full-page-load', action='store_true', help="경량 프로필 없이 모든 리소스를 로드 (비교용)")
+    parser.add_argument('--timings', default="page_timings.csv", help="페이지별 로드 / 추출 시간 CSV")
+    parser.add_argument('--extraction', choices=['http', 'browser'], default='http',
+                        help="선수 페이지 추출 방식 (http: 내장 JSON 우선, 실패 시 브라우저)")
+    args = parser.parse_args()
 
-    # 전체 데이터를 누적할 리스트
-    all_goalkeepers_data = []
-    all_outfield_players_data = []
+    # 선수 단위로 기록을 추가 저장하므로 중단 후 다시 실행하면 이어서 수집
+    checkpoint = CrawlCheckpoint()
+    if args.restart:
+        checkpoint.reset()
 
-    for team_url in team_urls:
-        players = get_player_list(driver, team_url)
-        
-        if not players:
-            print(f"'{team_url}'에서 선수 정보를 찾지 못해 다음 팀으로 넘어갑니다.")
-            continue
-            
-        print(f"총 {len(players)}명의 선수 정보를 찾았습니다. 각 선수 페이지에서 상세 스탯을 추출합니다...")
-        
-        for i, player in enumerate(players):
-            print(f"({i+1}/{len(players)}) {player['name']} 선수 데이터 처리 중...")
-            
-            full_player_url = player['url']
-            details = get_player_details(driver, full_player_url)
-            
-            if details:
-                # 기본 정보와 상세 정보를 결합
-                player_full_data = player.copy()
-                player_full_data['primary_position'] = details.get('primary_position')
-                player_full_data['height'] = details.get('height')
-                player_full_data['shirt'] = details.get('shirt')
-                player_full_data['preferred_foot'] = details.get('preferred_foot')
-                player_full_data['market_value'] = details.get('market_value')
-                
-                # 시즌 스탯 추가
-                if 'season_stats' in details:
-                    player_full_data.update(details['season_stats'])
-                
-                # 포지션에 따라 데이터 리스트에 추가
-                # 주 포지션(primary_position)을 기준으로 GK 여부 판단
-                if details.get('primary_position') == 'GK':
-                    all_goalkeepers_data.append(player_full_data)
-                else:
-                    all_outfield_players_data.append(player_full_data)
-            
-            time.sleep(1) # 서버 부하 방지
-
-        # 한 팀의 작업이 끝날 때마다 현재까지 누적된 전체 데이터를 CSV 파일로 덮어쓰기
-        print(f"'{team_url.split('/')[-1]}' 팀의 데이터 수집 완료. CSV 파일을 업데이트합니다...")
-        save_to_csv(all_goalkeepers_data, "all_teams_goalkeepers_detailed_stats.csv")
-        save_to_csv(all_outfield_players_data, "all_teams_outfield_players_detailed_stats.csv")
-    
-    driver.quit()
+    timings = PageTimings()
+    all_goalkeepers_data, all_outfield_players_data = crawl_teams(
+        team_urls, args.workers, args.rps, checkpoint, lightweight=not args.full_page_load, timings=timings,
+        extraction=args.extraction
+    )
+    timings.save_csv(args.timings)
+    print(f"페이지 타이밍: {timings.summary()}")
+    save_to_csv(all_goalkeepers_data, "all_teams_goalkeepers_detailed_stats.csv")
+    save_to_csv(all_outfield_players_data, "all_teams_outfield_players_detailed_stats.csv")
     print("\n모든 작업이 완료되었습니다.")
@@ -0,0 +1,43 @@
+import pulselive_cache
+from pulselive_cache import ResponseCache
+
+BASE_URL = "https://footballapi.pulselive.com/football"
+
+
+class FakeClock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+def make_cache(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(pulselive_cache.time, 'time', clock.time)
+    return ResponseCache(':memory:', current_ttl=600), clock
+
+
+def test_completed_season_never_expires(monkeypatch):
+    cache, clock = make_cache(monkeypatch)
+    cache.put(f"{BASE_URL}/fixtures", {'compSeasons': 578, 'page': 0}, b'{"content": []}')
+    clock.now += 365 * 86400
+    assert cache.get(f"{BASE_URL}/fixtures", {'compSeasons': '578', 'page': 0}) == b'{"content": []}'
+
+
+def test_unlisted_season_expires(monkeypatch):
+    cache, clock = make_cache(monkeypatch)
+    # 목록에 없는 시즌 id (새 시즌 등) 는 진행 중인 시즌과 같이 짧은 TTL 로 캐시
+    for season_id in [719, 9999]:
+        url = f"{BASE_URL}/players"
+        cache.put(url, {'compSeasons': season_id, 'teams': 1}, b'{"content": []}')
+        assert cache.get(url, {'compSeasons': season_id, 'teams': 1}) is not None
+        clock.now += 601
+        assert cache.get(url, {'compSeasons': season_id, 'teams': 1}) is None
+    assert cache.stats['expired'] == 2
+
+
+def test_mixed_seasons_use_short_ttl(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    _, path, query = cache.normalize(f"{BASE_URL}/fixtures", {'compSeasons': '578,719'})
+    assert cache.ttl_for(path, query) == 600
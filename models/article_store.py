@@ -0,0 +1,137 @@
+# article_store.py
+import json
+import sqlite3
+import zlib
+
+import pandas as pd
+
+from media_aggregates import to_naive
+
+try:
+    import zstandard
+    _zstd_compressor = zstandard.ZstdCompressor(level=10)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+except ImportError:
+    zstandard = None
+
+META_COLUMNS = ['url', 'source', 'date', 'title', 'summary', 'teams',
+                'title_polarity', 'title_subjectivity', 'polarity', 'subjectivity']
+BODY_COLUMNS = ['content', 'raw_html']
+
+
+def compress(text):
+    """zstandard 가 설치되어 있으면 zstd, 아니면 zlib 으로 압축 -> (codec, bytes)"""
+    if text is None:
+        return None, None
+    data = text.encode('utf-8')
+    if zstandard is not None:
+        return 'zstd', _zstd_compressor.compress(data)
+    return 'zlib', zlib.compress(data, 6)
+
+
+def decompress(codec, blob):
+    if blob is None:
+        return None
+    if codec == 'zstd':
+        return _zstd_decompressor.decompress(blob).decode('utf-8')
+    return zlib.decompress(blob).decode('utf-8')
+
+
+def format_date(date):
+    """UTC 기준 naive 초 단위 ISO 문자열 (문자열 비교로 날짜 범위 필터가 동작하도록 형식을 통일)"""
+    if date is None or date is pd.NaT:
+        return None
+    try:
+        return to_naive(date).isoformat(timespec='seconds')
+    except (TypeError, ValueError):
+        return None
+
+
+class ArticleStore:
+    """
+    추가 전용(append-only) 압축 기사 저장소 (SQLite).
+    URL 을 기본 키로, 날짜에 인덱스를 두고 본문 / 원본 HTML 은 압축하여 저장합니다.
+    read() 는 요청한 컬럼만 읽으며, 본문 컬럼을 요청하지 않으면 압축 해제도 하지 않습니다.
+    """
+
+    def __init__(self, path="articles.sqlite"):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS articles (
+                url TEXT PRIMARY KEY,
+                source TEXT,
+                date TEXT,
+                title TEXT,
+                summary TEXT,
+                teams TEXT,
+                title_polarity REAL,
+                title_subjectivity REAL,
+                polarity REAL,
+                subjectivity REAL,
+                codec TEXT,
+                content BLOB,
+                raw_html BLOB
+            );
+            CREATE INDEX IF NOT EXISTS idx_articles_date ON articles (date);
+        """)
+
+    def append(self, articles, include_raw_html=False):
+        """새 URL 의 기사만 추가 (기존 기사는 변경하지 않음). 추가된 건수 반환"""
+        rows = []
+        for article in articles:
+            codec, content = compress(article.get('content'))
+            _, raw_html = compress(article.get('raw_html')) if include_raw_html else (None, None)
+            rows.append((
+                article['url'], article.get('source'),
+                format_date(article.get('date')),
+                article.get('title'), article.get('summary'), json.dumps(article.get('teams', [])),
+                article.get('title_polarity'), article.get('title_subjectivity'),
+                article.get('polarity'), article.get('subjectivity'),
+                codec, content, raw_html
+            ))
+        before = self.conn.total_changes
+        self.conn.executemany(
+            f"INSERT OR IGNORE INTO articles ({', '.join(META_COLUMNS)}, codec, {', '.join(BODY_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * (len(META_COLUMNS) + 1 + len(BODY_COLUMNS)))})",
+            rows
+        )
+        self.conn.commit()
+        return self.conn.total_changes - before
+
+    def read(self, columns=None, start=None, end=None, urls=None):
+        """필요한 컬럼만 DataFrame 으로 로드 (start / end 는 날짜 범위, urls 는 URL 목록)"""
+        columns = columns or META_COLUMNS
+        unknown = set(columns) - set(META_COLUMNS) - set(BODY_COLUMNS)
+        if unknown:
+            raise ValueError(f"알 수 없는 컬럼: {sorted(unknown)}")
+        body_columns = [c for c in columns if c in BODY_COLUMNS]
+        select = list(columns) + (['codec'] if body_columns else [])
+
+        conditions, params = [], []
+        if start is not None:
+            conditions.append("date >= ?")
+            params.append(format_date(start))
+        if end is not None:
+            conditions.append("date < ?")
+            params.append(format_date(end))
+        if urls is not None:
+            urls = list(urls)
+            conditions.append(f"url IN ({', '.join('?' * len(urls))})")
+            params.extend(urls)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        df = pd.read_sql_query(f"SELECT {', '.join(select)} FROM articles{where} ORDER BY date", self.conn, params=params)
+        for column in body_columns:
+            df[column] = [decompress(codec, blob) for codec, blob in zip(df['codec'], df[column])]
+        if body_columns:
+            df = df.drop(columns='codec')
+        if 'date' in df.columns:
+            df['date'] = pd.to_datetime(df['date'], format='ISO8601', errors='coerce')
+        if 'teams' in df.columns:
+            df['teams'] = df['teams'].map(lambda value: json.loads(value) if value else [])
+        return df
+
+    def export_csv(self, path, columns=None):
+        """기존 CSV 덤프가 필요한 경우를 위한 내보내기"""
+        self.read(columns).to_csv(path, index=False)
@@ -0,0 +1,208 @@
+# bench_media_fetch.py
+"""
+BBC 기사 수집 벤치마크 (로컬 HTTP 대체 서버 사용).
+
+--recorded-dir 의 녹화 페이지(listing_<page>.html + URL 경로별 페이지, 예: sport/football/articles/c4gl0lpzjzyo.html)를
+요청 경로 그대로 서빙하고, 없으면 합성 페이지를 서빙합니다. 응답마다 --latency 만큼 지연을 주어 실제 네트워크를 흉내냅니다.
+1) 다운로드만: 스레드 풀(requests) 방식과 asyncio 다운로더의 articles/s 비교
+2) 전체 파이프라인: FootballMediaAnalyzer 의 다운로드 -> 파싱(newspaper) -> 요약(SummarizationStage) 단계별 처리량
+
+recorded_bbc/ 는 football_news_analysis.csv 에 남아 있는 BBC 기사(제목 / 본문)를 실제 URL 경로로 재구성한 페이지이며,
+네트워크가 되는 환경에서 --record 로 실제 BBC 페이지를 다시 녹화할 수 있습니다.
+
+    python bench_media_fetch.py --recorded-dir recorded_bbc --latency 150 --per-host 8
+    python bench_media_fetch.py --record recorded_bbc
+"""
+import argparse
+import asyncio
+import glob
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+from aiohttp import web
+
+import media_score
+from media_fetch import DEFAULT_HEADERS, AsyncArticleFetcher
+from media_score import FootballMediaAnalyzer, extract_article_links, get_summarizer
+
+LISTING_PAGES = 5
+EMPTY_LISTING = "<html><body></body></html>"
+
+
+def page_file(recorded_dir, path):
+    """URL 경로 -> 녹화 파일 경로 (/sport/football/articles/abc -> sport/football/articles/abc.html)"""
+    return os.path.join(recorded_dir, *path.strip('/').split('/')) + '.html'
+
+
+def load_pages(recorded_dir, n_articles):
+    """({목록 페이지 번호: html}, {URL 경로: html}) 로드"""
+    if recorded_dir:
+        listings, pages = {}, {}
+        for path in glob.glob(os.path.join(recorded_dir, 'listing_*.html')):
+            with open(path, encoding='utf-8') as f:
+                listings[int(re.search(r'listing_(\d+)', path).group(1))] = f.read()
+        for path in glob.glob(os.path.join(recorded_dir, 'sport', '**', '*.html'), recursive=True):
+            url_path = '/' + os.path.relpath(path, recorded_dir)[:-len('.html')].replace(os.sep, '/')
+            with open(path, encoding='utf-8') as f:
+                pages[url_path] = f.read()
+        return listings, pages
+
+    body = "<p>" + "Premier League match report paragraph. " * 60 + "</p>"
+    pages = {
+        f"/sport/football/articles/c{i:06d}synth": f"<html><head><title>Article {i}</title></head><body><h1>Article {i}</h1>{body}</body></html>"
+        for i in range(n_articles)
+    }
+    paths = list(pages)
+    per_page = max(1, len(paths) // LISTING_PAGES)
+    listings = {
+        page: "<html><body>" + ''.join(
+            f'<a href="{path}">{path}</a>' for path in paths[(page - 1) * per_page:page * per_page]
+        ) + "</body></html>"
+        for page in range(1, LISTING_PAGES + 1)
+    }
+    return listings, pages
+
+
+def record_pages(recorded_dir, max_articles=30):
+    """실제 BBC 목록 / 기사 페이지를 URL 경로별로 저장 (네트워크 필요)"""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    recorded = 0
+    for page in range(1, LISTING_PAGES + 1):
+        html = session.get(f"{media_score.BBC_BASE_URL}/sport/football?page={page}", timeout=10).text
+        with open(os.path.join(recorded_dir, f'listing_{page}.html'), 'w', encoding='utf-8') as f:
+            f.write(html)
+        for link in extract_article_links(html)[:max_articles // LISTING_PAGES]:
+            path = page_file(recorded_dir, urlparse(link).path)
+            if os.path.exists(path):
+                continue
+            response = session.get(link, timeout=10)
+            if response.status_code != 200:
+                continue
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(response.text)
+            recorded += 1
+    print(f"녹화 완료: {recorded}개 페이지 ({recorded_dir})")
+
+
+def build_app(listings, pages, latency):
+    async def listing_handler(request):
+        await asyncio.sleep(latency)
+        html = listings.get(int(request.query.get('page', 1)), EMPTY_LISTING)
+        return web.Response(text=html, content_type='text/html')
+
+    async def page_handler(request):
+        # 기사 id 는 영숫자(c4gl0lpzjzyo 등)이므로 요청 경로 그대로 조회
+        await asyncio.sleep(latency)
+        html = pages.get(request.path)
+        if html is None:
+            raise web.HTTPNotFound()
+        return web.Response(text=html, content_type='text/html')
+
+    app = web.Application()
+    app.router.add_get('/sport/football', listing_handler)
+    app.router.add_get('/sport/football/{tail:.+}', page_handler)
+    return app
+
+
+def start_server(app, port):
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, '127.0.0.1', port).start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+
+
+def to_local(links, base_url):
+    # 녹화된 페이지의 BBC 절대 링크를 로컬 서버 주소로 변경
+    return [link.replace("https://www.bbc.com", base_url) for link in links]
+
+
+def bench_threads(base_url, listing_urls, max_articles, workers):
+    started = time.perf_counter()
+    count = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for url in listing_urls:
+            links = to_local(extract_article_links(requests.get(url, timeout=10).text), base_url)
+            for response in executor.map(lambda link: requests.get(link, timeout=10), links[:max_articles // LISTING_PAGES]):
+                count += response.status_code == 200
+    return count, time.perf_counter() - started
+
+
+async def bench_async(base_url, listing_urls, max_articles, per_host):
+    started = time.perf_counter()
+    count = 0
+    async with AsyncArticleFetcher(per_host_limit=per_host, total_limit=per_host) as fetcher:
+        async for _, html in fetcher.stream_articles(
+            listing_urls, lambda html: to_local(extract_article_links(html), base_url),
+            max_articles, per_listing=max_articles // LISTING_PAGES
+        ):
+            count += html is not None
+    return count, time.perf_counter() - started
+
+
+def bench_pipeline(base_url, max_articles, fetch_mode, per_host, summary_batch_size):
+    """다운로드 -> 파싱 -> 요약 전체 스트림을 로컬 서버 대상으로 실행 -> (기사 수, 총 초, 단계별 통계)"""
+    # 목록 URL / 상대 링크가 로컬 서버를 가리키도록 변경
+    media_score.BBC_BASE_URL = base_url
+    with tempfile.TemporaryDirectory() as work_dir:
+        analyzer = FootballMediaAnalyzer(
+            cache_path=None, fetch_mode=fetch_mode, per_host_limit=per_host,
+            summary_batch_size=summary_batch_size,
+            aggregates_path=os.path.join(work_dir, 'aggregates.json'),
+            store_path=os.path.join(work_dir, 'articles.sqlite')
+        )
+        started = time.perf_counter()
+        articles = analyzer.scrape_bbc_web(max_articles)
+        elapsed = time.perf_counter() - started
+    return len(articles), elapsed, analyzer.stage_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 수집 벤치마크")
+    parser.add_argument("--recorded-dir", default=None)
+    parser.add_argument("--record", metavar="DIR", help="실제 BBC 페이지를 DIR 에 녹화하고 종료")
+    parser.add_argument("--articles", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=150, help="응답 지연 (ms)")
+    parser.add_argument("--workers", type=int, default=10, help="스레드 풀 방식 워커 수")
+    parser.add_argument("--per-host", type=int, default=10, help="asyncio 방식 호스트별 동시 요청 수")
+    parser.add_argument("--summary-batch-size", type=int, default=8)
+    parser.add_argument("--download-only", action="store_true", help="파싱 / 요약 파이프라인 벤치 생략")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    if args.record:
+        os.makedirs(args.record, exist_ok=True)
+        record_pages(args.record, args.articles)
+        return
+
+    listings, pages = load_pages(args.recorded_dir, args.articles)
+    start_server(build_app(listings, pages, args.latency / 1000), args.port)
+    base_url = f"http://127.0.0.1:{args.port}"
+    listing_urls = [f"{base_url}/sport/football?page={page}" for page in range(1, LISTING_PAGES + 1)]
+
+    for name, (count, elapsed) in [
+        ("download threads", bench_threads(base_url, listing_urls, args.articles, args.workers)),
+        ("download async", asyncio.run(bench_async(base_url, listing_urls, args.articles, args.per_host))),
+    ]:
+        print(f"[{name}] {count}개 기사, {elapsed:.2f}초 ({count / elapsed:.2f} articles/s)")
+
+    if args.download_only:
+        return
+    # 요약 모델 로드 시간은 측정에서 제외
+    get_summarizer()
+    for fetch_mode in ["threads", "async"]:
+        count, elapsed, stages = bench_pipeline(base_url, args.articles, fetch_mode, args.per_host, args.summary_batch_size)
+        print(f"[pipeline {fetch_mode}] {count}개 기사, {elapsed:.2f}초 ({count / elapsed:.2f} articles/s) - "
+              f"download {stages['download']}, summarize {stages['summarize']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# media_aggregates.py
+import json
+import math
+import os
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+
+def to_naive(date):
+    """타임존 정보가 있는 날짜를 UTC 기준 naive datetime 으로 변환"""
+    if date is None:
+        return datetime.now()
+    timestamp = pd.Timestamp(date)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert('UTC').tz_localize(None)
+    return timestamp.to_pydatetime()
+
+
+class TeamMediaAggregates:
+    """
+    팀별 지수 감쇠 미디어 점수 누적값 (가중 합 / 가중치 합).
+    새 기사 N개 반영 비용은 O(N)이며, 과거 기사를 다시 읽지 않고 임의 시점(ref_time 이후)의 점수를 계산합니다.
+    prior_weight 는 중립(0점) 사전값의 가중치로, 새 기사가 없으면 점수가 점차 0으로 수렴합니다.
+    기사를 반영할 때마다 (팀, 반영 시점, 점수) 를 history_path 에 추가하여 시간 인덱스 이력을 남깁니다.
+    중복 반영 방지용 (팀, 기사) 키는 기사 날짜와 함께 보관하고, 팀 ref_time 기준 horizon_half_lives 반감기보다
+    오래된 키와 기사는 버립니다 (기여도 2^-horizon_half_lives 미만). 상태 파일 크기는 최근 기사 수에만 비례합니다.
+    """
+
+    def __init__(self, path="team_media_aggregates.json", half_life_days=10.0, prior_weight=0.5,
+                 history_path="team_media_score_history.csv", horizon_half_lives=10):
+        self.path = path
+        self.history_path = history_path
+        self.pending_history = []
+        self.tau = half_life_days / math.log(2)
+        self.prior_weight = prior_weight
+        self.horizon = timedelta(days=half_life_days * horizon_half_lives)
+        self.teams = {}
+        # "팀|url" -> 기사 날짜 (horizon 안의 기사만 유지)
+        self.ingested = {}
+        if path and os.path.exists(path):
+            self.load()
+
+    def _decay(self, from_time, to_time):
+        return math.exp(-(to_time - from_time).total_seconds() / 86400 / self.tau)
+
+    def ingest(self, team, url, date, value, weight=1.0):
+        """(팀, 기사) 단위로 한 번만 반영. 이미 반영된 기사면 False"""
+        key = f"{team}|{url}"
+        if key in self.ingested:
+            return False
+        date = to_naive(date)
+        state = self.teams.setdefault(team, {'sum': 0.0, 'weight': 0.0, 'ref_time': date})
+        if date < state['ref_time'] - self.horizon:
+            # 기여도가 무시할 수준인 오래된 기사는 반영 / 기록하지 않음
+            return False
+
+        if date > state['ref_time']:
+            # 기준 시점을 최신 기사로 옮겨 누적값을 감쇠 (지수 오버플로 방지)
+            decay = self._decay(state['ref_time'], date)
+            state['sum'] *= decay
+            state['weight'] *= decay
+            state['ref_time'] = date
+            contribution = weight
+        else:
+            contribution = weight * self._decay(date, state['ref_time'])
+
+        state['sum'] += value * contribution
+        state['weight'] += contribution
+        self.ingested[key] = date
+        # 과거 기사가 늦게 들어와도 이력은 ref_time(반영 시점)에 기록되어 이전 시점 점수를 바꾸지 않음
+        self.pending_history.append({
+            'team': team,
+            'date': state['ref_time'].isoformat(timespec='seconds'),
+            'media_score': round(self.score(team, state['ref_time']) * 10, 4),
+            # 이력 조회 시 이후 시점까지 같은 감쇠를 적용하기 위한 누적 가중치
+            'weight': round(state['weight'], 6)
+        })
+        return True
+
+    def score(self, team, at=None):
+        """
+        at 시점의 가중 평균 점수 (at 이 없으면 현재 시각).
+        누적값은 ref_time 이전 상태를 보관하지 않으므로 at 이 ref_time 보다 이르면 ref_time 시점 점수를 반환합니다
+        (과거 시점 점수는 history_path 이력을 사용).
+        """
+        state = self.teams.get(team)
+        if not state:
+            return 0.0
+        at = max(to_naive(at), state['ref_time'])
+        decay = self._decay(state['ref_time'], at)
+        return state['sum'] * decay / (state['weight'] * decay + self.prior_weight)
+
+    def scores(self, at=None):
+        return {team: self.score(team, at) for team in self.teams}
+
+    def load(self):
+        with open(self.path, encoding='utf-8') as f:
+            data = json.load(f)
+        self.teams = {
+            team: {**state, 'ref_time': datetime.fromisoformat(state['ref_time'])}
+            for team, state in data['teams'].items()
+        }
+        ingested = data['ingested']
+        if isinstance(ingested, list):
+            # 이전 형식 (날짜 없는 키 목록): 팀 ref_time 을 기사 날짜로 간주하여 horizon 이후 정리
+            ingested = {key: self.teams[key.split('|', 1)[0]]['ref_time'].isoformat()
+                        for key in ingested if key.split('|', 1)[0] in self.teams}
+        self.ingested = {key: datetime.fromisoformat(date) for key, date in ingested.items()}
+
+    def prune(self):
+        """팀 ref_time 기준 horizon 보다 오래된 (팀, 기사) 키 제거. 제거한 키 수 반환"""
+        before = len(self.ingested)
+        self.ingested = {
+            key: date for key, date in self.ingested.items()
+            if key.split('|', 1)[0] in self.teams
+            and date >= self.teams[key.split('|', 1)[0]]['ref_time'] - self.horizon
+        }
+        return before - len(self.ingested)
+
+    def save(self):
+        if not self.path:
+            return
+        self.prune()
+        data = {
+            'teams': {team: {**state, 'ref_time': state['ref_time'].isoformat()} for team, state in self.teams.items()},
+            'ingested': {key: date.isoformat(timespec='seconds') for key, date in self.ingested.items()}
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+        if self.history_path and self.pending_history:
+            pd.DataFrame(self.pending_history).to_csv(
+                self.history_path, mode='a', index=False, header=not os.path.exists(self.history_path)
+            )
+            self.pending_history = []
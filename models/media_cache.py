@@ -0,0 +1,115 @@
+# media_cache.py
+import json
+import sqlite3
+import threading
+from datetime import datetime
+
+
+class ArticleCache:
+    """
+    URL 기준 기사 캐시 (SQLite).
+    - articles: 파싱된 기사 / 요약 / 감성 분석 결과
+    - resources: RSS 피드, 목록 페이지의 ETag / Last-Modified 와 마지막으로 본 기사 URL 목록
+    - sentiments: 본문 해시 기준 감성 분석 결과 (백엔드별)
+    """
+
+    def __init__(self, path="media_cache.sqlite"):
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS articles (
+                url TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS resources (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                links TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS sentiments (
+                hash TEXT NOT NULL,
+                backend TEXT NOT NULL,
+                polarity REAL NOT NULL,
+                subjectivity REAL NOT NULL,
+                PRIMARY KEY (hash, backend)
+            );
+        """)
+
+    @staticmethod
+    def _encode(article):
+        payload = {k: v for k, v in article.items() if k != 'raw_html'}
+        if isinstance(payload.get('date'), datetime):
+            payload['date'] = payload['date'].isoformat()
+        return json.dumps(payload, ensure_ascii=False)
+
+    @staticmethod
+    def _decode(payload):
+        article = json.loads(payload)
+        if article.get('date'):
+            article['date'] = datetime.fromisoformat(article['date'])
+        article['raw_html'] = None
+        return article
+
+    def get_article(self, url):
+        with self._lock:
+            row = self.conn.execute("SELECT payload FROM articles WHERE url = ?", (url,)).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def get_articles(self, urls):
+        """URL 순서를 유지하여 캐시된 기사 반환 (없는 URL 은 제외)"""
+        articles = (self.get_article(url) for url in urls)
+        return [a for a in articles if a]
+
+    def put_articles(self, articles):
+        now = datetime.now().isoformat()
+        with self._lock:
+            self.conn.executemany(
+                "REPLACE INTO articles (url, payload, updated_at) VALUES (?, ?, ?)",
+                [(a['url'], self._encode(a), now) for a in articles]
+            )
+            self.conn.commit()
+
+    def get_resource(self, url):
+        """조건부 요청용 검증자 조회 -> {'etag', 'last_modified', 'links'}"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, links FROM resources WHERE url = ?", (url,)
+            ).fetchone()
+        if not row:
+            return {}
+        return {'etag': row[0], 'last_modified': row[1], 'links': json.loads(row[2])}
+
+    def put_resource(self, url, etag, last_modified, links):
+        with self._lock:
+            self.conn.execute(
+                "REPLACE INTO resources (url, etag, last_modified, links) VALUES (?, ?, ?, ?)",
+                (url, etag, last_modified, json.dumps(links))
+            )
+            self.conn.commit()
+
+    def get_sentiments(self, hashes, backend):
+        """{hash: {'polarity', 'subjectivity'}} (캐시에 있는 것만)"""
+        hashes = list(hashes)
+        found = {}
+        with self._lock:
+            # SQLite 파라미터 개수 제한을 피하기 위해 나누어 조회
+            for i in range(0, len(hashes), 500):
+                chunk = hashes[i:i + 500]
+                rows = self.conn.execute(
+                    f"SELECT hash, polarity, subjectivity FROM sentiments "
+                    f"WHERE backend = ? AND hash IN ({','.join('?' * len(chunk))})",
+                    [backend, *chunk]
+                ).fetchall()
+                found.update({row[0]: {'polarity': row[1], 'subjectivity': row[2]} for row in rows})
+        return found
+
+    def put_sentiments(self, sentiments, backend):
+        with self._lock:
+            self.conn.executemany(
+                "REPLACE INTO sentiments (hash, backend, polarity, subjectivity) VALUES (?, ?, ?, ?)",
+                [(key, backend, value['polarity'], value['subjectivity']) for key, value in sentiments.items()]
+            )
+            self.conn.commit()
@@ -0,0 +1,127 @@
+# media_fetch.py
+import asyncio
+import random
+from urllib.parse import urlparse
+
+import aiohttp
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36'
+}
+
+
+class AsyncArticleFetcher:
+    """
+    asyncio 기반 기사 다운로더.
+    하나의 aiohttp 세션(커넥션 풀)을 공유하고, 호스트별 동시 요청 수 제한 / 타임아웃 / 재시도를 적용합니다.
+    """
+
+    def __init__(self, per_host_limit=4, total_limit=20, timeout=10, retries=3, backoff=0.5, headers=None):
+        self.per_host_limit = per_host_limit
+        self.total_limit = total_limit
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.headers = headers or DEFAULT_HEADERS
+        self.session = None
+        self._host_limits = {}
+
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.total_limit),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers=self.headers
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+
+    def _host_limit(self, url):
+        host = urlparse(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_limits[host]
+
+    async def fetch(self, url, headers=None):
+        """GET 요청 -> (status, text, response headers). 429/5xx/네트워크 오류는 지수 백오프로 재시도"""
+        for attempt in range(self.retries + 1):
+            delay = self.backoff * (2 ** attempt)
+            try:
+                async with self._host_limit(url):
+                    async with self.session.get(url, headers=headers) as response:
+                        if response.status not in RETRY_STATUS or attempt == self.retries:
+                            return response.status, await response.text(), dict(response.headers)
+                        retry_after = response.headers.get('Retry-After')
+                        if retry_after and retry_after.isdigit():
+                            delay = float(retry_after)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == self.retries:
+                    raise
+            await asyncio.sleep(delay + random.uniform(0, self.backoff))
+
+    async def fetch_links(self, listing_url, extract_links, cache=None):
+        """목록 페이지 링크 추출 (cache 가 있으면 ETag / Last-Modified 조건부 요청)"""
+        cached = cache.get_resource(listing_url) if cache else {}
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        status, html, response_headers = await self.fetch(listing_url, headers=headers)
+        if status == 304 and cached:
+            return cached['links']
+        links = extract_links(html)
+        if cache:
+            cache.put_resource(listing_url, response_headers.get('ETag'), response_headers.get('Last-Modified'), links)
+        return links
+
+    async def stream_articles(self, listing_urls, extract_links, max_articles, per_listing=None,
+                              should_fetch=None, cache=None):
+        """
+        목록 페이지들을 동시에 받아 기사 다운로드를 예약하고,
+        다운로드가 끝나는 순서대로 (url, html) 을 yield 합니다. 실패한 기사는 html 이 None 입니다.
+        """
+        results = asyncio.Queue()
+        scheduled = set()
+        article_tasks = []
+        done = object()
+
+        async def fetch_article(url):
+            try:
+                status, html, _ = await self.fetch(url)
+                await results.put((url, html if status == 200 else None))
+            except Exception as e:
+                print(f"기사 다운로드 오류 [{url}]: {e}")
+                await results.put((url, None))
+
+        async def handle_listing(listing_url):
+            try:
+                links = await self.fetch_links(listing_url, extract_links, cache)
+            except Exception as e:
+                print(f"목록 페이지 오류 [{listing_url}]: {e}")
+                return
+            for link in links[:per_listing]:
+                if len(scheduled) >= max_articles or link in scheduled:
+                    continue
+                if should_fetch and not should_fetch(link):
+                    continue
+                scheduled.add(link)
+                article_tasks.append(asyncio.create_task(fetch_article(link)))
+
+        async def coordinate():
+            await asyncio.gather(*(handle_listing(url) for url in listing_urls))
+            await asyncio.gather(*article_tasks)
+            await results.put(done)
+
+        coordinator = asyncio.create_task(coordinate())
+        try:
+            while True:
+                item = await results.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            await coordinator
@@ -0,0 +1,73 @@
+# media_keywords.py
+from collections import Counter
+
+import numpy as np
+from scipy.sparse import csr_matrix, vstack
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.preprocessing import normalize
+
+
+class CorpusKeywordIndex:
+    """
+    전체 기사 코퍼스 기준 TF-IDF 인덱스.
+    기사는 한 번만 토큰화되어 희소 행렬의 한 행으로 저장되고, 새 기사가 들어오면 어휘 / 문서 빈도를 점진적으로 갱신합니다.
+    팀별 키워드는 해당 팀 기사 행의 TF-IDF 합으로 계산하므로 팀 간 IDF 가중치가 동일합니다.
+    """
+
+    def __init__(self, stop_words='english'):
+        self.analyzer = CountVectorizer(stop_words=stop_words).build_analyzer()
+        self.vocabulary = {}
+        self.feature_names = []
+        self.doc_freq = np.zeros(0, dtype=np.int64)
+        self.doc_index = {}
+        self.n_docs = 0
+        self.blocks = []
+        self._tfidf = None
+
+    def add_documents(self, documents):
+        """(key, text) 목록 중 새 문서만 토큰화하여 인덱스에 추가. 추가된 문서 수 반환"""
+        # 한 팀 언급당 한 쌍이 들어오므로 같은 배치 안의 중복 key 도 한 행으로 합침
+        new_docs = list({key: text for key, text in documents if key not in self.doc_index}.items())
+        if not new_docs:
+            return 0
+
+        indices, data, indptr = [], [], [0]
+        for key, text in new_docs:
+            for term, count in Counter(self.analyzer(text)).items():
+                if term not in self.vocabulary:
+                    self.vocabulary[term] = len(self.feature_names)
+                    self.feature_names.append(term)
+                indices.append(self.vocabulary[term])
+                data.append(count)
+            indptr.append(len(indices))
+            self.doc_index[key] = self.n_docs
+            self.n_docs += 1
+
+        n_terms = len(self.feature_names)
+        self.blocks.append(csr_matrix((data, indices, indptr), shape=(len(new_docs), n_terms), dtype=np.float64))
+        # 한 문서 안에서 용어는 한 번만 등장하므로 indices 로 바로 문서 빈도 갱신
+        self.doc_freq = np.concatenate([self.doc_freq, np.zeros(n_terms - len(self.doc_freq), dtype=np.int64)])
+        np.add.at(self.doc_freq, np.asarray(indices, dtype=np.int64), 1)
+        self._tfidf = None
+        return len(new_docs)
+
+    def tfidf(self):
+        """(문서 수 x 어휘 수) TF-IDF 행렬 (sklearn TfidfVectorizer 기본 설정과 같은 smooth idf + l2 정규화)"""
+        if self._tfidf is None:
+            n_terms = len(self.feature_names)
+            counts = vstack([
+                csr_matrix((block.data, block.indices, block.indptr), shape=(block.shape[0], n_terms))
+                for block in self.blocks
+            ]).tocsr()
+            idf = np.log((1 + self.n_docs) / (1 + self.doc_freq)) + 1
+            self._tfidf = normalize(counts.multiply(idf).tocsr())
+        return self._tfidf
+
+    def top_keywords(self, keys, k=10):
+        """주어진 문서들의 TF-IDF 합 기준 상위 k개 키워드"""
+        rows = [self.doc_index[key] for key in keys if key in self.doc_index]
+        if not rows:
+            return []
+        scores = np.asarray(self.tfidf()[rows].sum(axis=0)).ravel()
+        top_indices = scores.argsort()[-k:][::-1]
+        return [self.feature_names[i] for i in top_indices if scores[i] > 0]
@@ -1,16 +1,25 @@
 # football_media_analyzer.py
 import re
+import time
+import asyncio
+import queue
+import threading
+import resource
 import requests
 import pandas as pd
 from datetime import datetime
 from bs4 import BeautifulSoup
 from newspaper import Article
-from textblob import TextBlob
-from transformers import pipeline
 from concurrent.futures import ThreadPoolExecutor
 from sklearn.feature_extraction.text import TfidfVectorizer
 import feedparser
 import numpy as np
+from media_cache import ArticleCache
+from media_fetch import AsyncArticleFetcher
+from media_aggregates import TeamMediaAggregates, to_naive
+from media_sentiment import SentimentScorer
+from media_keywords import CorpusKeywordIndex
+from article_store import ArticleStore
 
 # 환경 설정
 BBC_BASE_URL = "https://www.bbc.com"
@@ -24,19 +33,199 @@ PREMIER_LEAGUE_TEAMS = [
     "Wolverhampton Wanderers"
 ]
 
+# 팀별 별칭 (팀 정식 명칭은 자동 포함)
+TEAM_ALIASES = {
+    "Arsenal": ["Gunners"],
+    "Aston Villa": ["Villa"],
+    "Brentford": ["Bees"],
+    "Brighton": ["Brighton & Hove Albion", "Brighton and Hove Albion", "Seagulls"],
+    "Crystal Palace": ["Palace"],
+    "Everton": ["Toffees"],
+    "Leeds United": ["Leeds"],
+    "Leicester City": ["Leicester", "Foxes"],
+    "Manchester City": ["Man City"],
+    "Manchester United": ["Man Utd", "Man United"],
+    "Newcastle United": ["Newcastle", "Magpies"],
+    "Southampton": ["Saints"],
+    "Tottenham Hotspur": ["Tottenham", "Spurs"],
+    "West Ham United": ["West Ham", "Hammers"],
+    "Wolverhampton Wanderers": ["Wolves", "Wolverhampton"]
+}
+
+def extract_article_links(html):
+    """BBC 축구 목록 페이지에서 기사 링크 추출 (영상 제외, 순서 유지)"""
+    soup = BeautifulSoup(html, 'html.parser')
+    links = []
+    for a in soup.find_all('a', href=re.compile(r'/sport/football/.*')):
+        href = a['href']
+        if '/video' not in href and '/av' not in href:
+            link = href if href.startswith('http') else f"{BBC_BASE_URL}{href}"
+            if link not in links:
+                links.append(link)
+    return links
+
+class TeamMentionMatcher:
+    """전체 팀 별칭을 하나의 정규식으로 컴파일하여 기사 본문 1회 탐색으로 언급 팀을 찾는 매처"""
+
+    def __init__(self, teams=PREMIER_LEAGUE_TEAMS, aliases=TEAM_ALIASES):
+        self.alias_to_team = {}
+        for team in teams:
+            for alias in [team] + aliases.get(team, []):
+                self.alias_to_team[alias.lower()] = team
+        # 긴 별칭을 우선 매칭 ("Manchester United" 가 "Man" 계열보다 먼저)
+        pattern = '|'.join(re.escape(alias) for alias in sorted(self.alias_to_team, key=len, reverse=True))
+        self.regex = re.compile(rf"\b(?:{pattern})\b", re.IGNORECASE)
+
+    def find_teams(self, text):
+        return {self.alias_to_team[m.group(0).lower()] for m in self.regex.finditer(text)}
+
+    def tag(self, article):
+        """기사에 언급된 팀 목록을 article['teams'] 에 저장"""
+        article['teams'] = sorted(self.find_teams(f"{article['title']} {article['content']}"))
+        return article['teams']
+
+    def build_index(self, articles):
+        """팀 -> 기사 목록 인덱스"""
+        team_articles = {team: [] for team in self.alias_to_team.values()}
+        for article in articles:
+            for team in self.tag(article):
+                team_articles[team].append(article)
+        return team_articles
+
+# 요약 모델은 첫 사용 시 한 번만 로드하여 모든 분석기 인스턴스가 공유
+_summarizer = None
+_summarizer_lock = threading.Lock()
+
+def get_summarizer():
+    """t5-small 요약 파이프라인 (지연 로딩, 프로세스 내 공유)"""
+    global _summarizer
+    if _summarizer is None:
+        with _summarizer_lock:
+            if _summarizer is None:
+                from transformers import pipeline
+                started = time.perf_counter()
+                _summarizer = pipeline("summarization", model="t5-small")
+                print(f"요약 모델 로드 완료 ({time.perf_counter() - started:.2f}초)")
+    return _summarizer
+
+def summarize_texts(texts, **kwargs):
+    return get_summarizer()(texts, **kwargs)
+
+class SummarizationStage:
+    """다운로드된 기사 본문을 모아 배치 단위로 요약하는 전용 워커 스레드"""
+    _STOP = object()
+
+    def __init__(self, summarizer, batch_size=8, max_wait=0.5):
+        self.summarizer = summarizer
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.queue = queue.Queue()
+        self.results = []
+        self.count = 0
+        self.elapsed = 0.0
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def submit(self, article):
+        self.queue.put(article)
+
+    def close(self):
+        """남은 기사 요약 후 결과 반환"""
+        self.queue.put(self._STOP)
+        self.thread.join()
+        return self.results
+
+    def _run(self):
+        stopped = False
+        while not stopped:
+            item = self.queue.get()
+            if item is self._STOP:
+                break
+            batch = [item]
+            # batch_size 만큼 모이거나 max_wait 가 지나면 배치 실행
+            deadline = time.time() + self.max_wait
+            while len(batch) < self.batch_size:
+                try:
+                    item = self.queue.get(timeout=max(0, deadline - time.time()))
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopped = True
+                    break
+                batch.append(item)
+            self._summarize(batch)
+
+    def _summarize(self, batch):
+        started = time.perf_counter()
+        try:
+            outputs = self.summarizer(
+                [article['content'][:1024] for article in batch],
+                max_length=150,
+                min_length=30,
+                do_sample=False,
+                truncation=True,
+                batch_size=len(batch)
+            )
+            for article, output in zip(batch, outputs):
+                article['summary'] = output['summary_text']
+        except Exception as e:
+            print(f"요약 배치 처리 오류: {e}")
+            for article in batch:
+                article['summary'] = None
+        self.elapsed += time.perf_counter() - started
+        self.count += len(batch)
+        self.results.extend(batch)
+
+
 class FootballMediaAnalyzer:
-    def __init__(self):
-        self.summarizer = pipeline("summarization", model="t5-small")
+    def __init__(self, download_workers=10, summary_batch_size=8, cache_path="media_cache.sqlite",
+                 fetch_mode="threads", per_host_limit=4, aggregates_path="team_media_aggregates.json",
+                 sentiment_backend=None, mode="full", store_path="articles.sqlite", store_raw_html=False):
+        started = time.perf_counter()
+        # 실행 모드: "full" (웹 기사 수집 + 요약) 또는 "scores_only" (RSS 기사 감성 점수만, 요약 모델 미사용)
+        self.mode = mode
+        self.download_workers = download_workers
+        # 웹 기사 다운로드 방식: "threads" (스레드 풀) 또는 "async" (asyncio 다운로더)
+        self.fetch_mode = fetch_mode
+        self.per_host_limit = per_host_limit
+        self.summary_batch_size = summary_batch_size
+        # URL 기준 기사 캐시 (None 이면 비활성화)
+        self.cache = ArticleCache(cache_path) if cache_path else None
+        # 압축 기사 저장소 (원본 HTML 저장은 선택)
+        self.store = ArticleStore(store_path)
+        self.store_raw_html = store_raw_html
         self.articles = []
         self.team_scores = {}
+        self.matcher = TeamMentionMatcher()
+        self.team_articles = {}
+        # 팀별 지수 감쇠 미디어 점수 누적값 (실행 간 유지)
+        self.aggregates = TeamMediaAggregates(aggregates_path)
+        # 본문 해시 캐시 + 교체 가능한 감성 분석 백엔드 (기본: TextBlob)
+        self.sentiment = SentimentScorer(sentiment_backend, self.cache)
+        # 전체 코퍼스 TF-IDF 인덱스 (실행 간 새 기사만 추가)
+        self.keyword_index = CorpusKeywordIndex()
+        self.stage_stats = {'startup': {'seconds': round(time.perf_counter() - started, 4)}}
 
     def fetch_bbc_rss_articles(self, max_articles=100):
-        """BBC RSS 피드에서 기사 수집"""
-        feed = feedparser.parse(BBC_FOOTBALL_RSS)
-        articles = []
+        """BBC RSS 피드에서 기사 수집 (ETag / Last-Modified 조건부 요청)"""
+        cached = self.cache.get_resource(BBC_FOOTBALL_RSS) if self.cache else {}
+        feed = feedparser.parse(BBC_FOOTBALL_RSS, etag=cached.get('etag'), modified=cached.get('last_modified'))
+        
+        if getattr(feed, 'status', None) == 304 and cached:
+            print("RSS 피드 변경 없음 - 캐시된 기사 사용")
+            return self.cache.get_articles(cached['links'])[:max_articles]
         
+        articles = []
+        new_articles = []
         for entry in feed.entries[:max_articles]:
             try:
+                cached_article = self.cache.get_article(entry.link) if self.cache else None
+                if cached_article:
+                    articles.append(cached_article)
+                    continue
                 pub_date = datetime(*entry.published_parsed[:6]) if hasattr(entry, 'published_parsed') else datetime.now()
                 articles.append({
                     'source': 'BBC RSS',
@@ -46,66 +235,141 @@ class FootballMediaAnalyzer:
                     'content': entry.summary,
                     'raw_html': None
                 })
+                new_articles.append(articles[-1])
             except Exception as e:
                 print(f"RSS 처리 오류: {e}")
         
+        if self.cache:
+            self.cache.put_articles(new_articles)
+            self.cache.put_resource(BBC_FOOTBALL_RSS, feed.get('etag'), feed.get('modified'),
+                                    [a['url'] for a in articles])
+        print(f"RSS 기사 {len(articles)}개 (신규 {len(new_articles)}개)")
         return articles
 
     def scrape_bbc_web(self, max_articles=50):
-        """BBC 웹사이트에서 기사 수집"""
-        articles = []
+        """BBC 웹사이트에서 기사 수집 (다운로드 스레드 풀 -> 요약 전용 워커로 전달)"""
+        if self.fetch_mode == "async":
+            return asyncio.run(self.scrape_bbc_web_async(max_articles))
+        
         page = 1
+        downloaded = 0
+        cached_articles = []
+        summarization = SummarizationStage(summarize_texts, self.summary_batch_size).start()
+        download_started = time.perf_counter()
         
-        while len(articles) < max_articles and page <= 5:
-            try:
-                url = f"{BBC_BASE_URL}/sport/football?page={page}"
-                response = requests.get(url, timeout=10)
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # 기사 링크 추출
-                links = set()
-                for a in soup.find_all('a', href=re.compile(r'/sport/football/.*')):
-                    href = a['href']
-                    if '/video' not in href and '/av' not in href:
-                        links.add(href if href.startswith('http') else f"{BBC_BASE_URL}{href}")
-                
-                # 기사 처리
-                with ThreadPoolExecutor(max_workers=10) as executor:
-                    results = executor.map(self.process_article, list(links)[:max_articles//5])
-                    articles.extend([res for res in results if res])
-                
-                page += 1
-            except Exception as e:
-                print(f"웹 크롤링 오류: {e}")
-                break
+        with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+            while downloaded < max_articles and page <= 5:
+                try:
+                    url = f"{BBC_BASE_URL}/sport/football?page={page}"
+                    links = self._fetch_listing_links(url)
+                    
+                    # 캐시에 있는 기사는 다운로드 / 요약 생략
+                    new_links = []
+                    for link in links[:max_articles//5]:
+                        cached_article = self.cache.get_article(link) if self.cache else None
+                        if cached_article:
+                            cached_articles.append(cached_article)
+                        else:
+                            new_links.append(link)
+                    
+                    # 다운로드 완료된 기사부터 요약 단계로 전달
+                    for res in executor.map(self.process_article, new_links):
+                        if res:
+                            summarization.submit(res)
+                            downloaded += 1
+                    
+                    page += 1
+                except Exception as e:
+                    print(f"웹 크롤링 오류: {e}")
+                    break
         
-        return articles
+        download_elapsed = time.perf_counter() - download_started
+        new_articles = summarization.close()
+        if self.cache:
+            self.cache.put_articles(new_articles)
+        self._record_stage('download', downloaded, download_elapsed)
+        self._record_stage('summarize', summarization.count, summarization.elapsed)
+        print(f"웹 기사 {len(cached_articles) + len(new_articles)}개 (캐시 {len(cached_articles)}개, 신규 {len(new_articles)}개)")
+        return cached_articles + new_articles
+
+    def _fetch_listing_links(self, url):
+        """목록 페이지에서 기사 링크 추출 (변경 없으면 304 응답 후 캐시된 링크 사용)"""
+        cached = self.cache.get_resource(url) if self.cache else {}
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = requests.get(url, headers=headers, timeout=10)
+        if response.status_code == 304 and cached:
+            return cached['links']
+        
+        links = extract_article_links(response.text)
+        if self.cache:
+            self.cache.put_resource(url, response.headers.get('ETag'), response.headers.get('Last-Modified'), links)
+        return links
+
+    async def scrape_bbc_web_async(self, max_articles=50):
+        """asyncio 다운로더로 목록 / 기사 페이지를 동시에 받아, 도착하는 순서대로 파싱 -> 요약 단계로 전달"""
+        listing_urls = [f"{BBC_BASE_URL}/sport/football?page={page}" for page in range(1, 6)]
+        cached_articles = []
+        downloaded = 0
+        summarization = SummarizationStage(summarize_texts, self.summary_batch_size).start()
+        download_started = time.perf_counter()
+        
+        def should_fetch(url):
+            cached_article = self.cache.get_article(url) if self.cache else None
+            if cached_article:
+                cached_articles.append(cached_article)
+                return False
+            return True
+        
+        async with AsyncArticleFetcher(per_host_limit=self.per_host_limit) as fetcher:
+            async for url, html in fetcher.stream_articles(
+                listing_urls, extract_article_links, max_articles,
+                per_listing=max_articles//5, should_fetch=should_fetch, cache=self.cache
+            ):
+                if html is None:
+                    continue
+                # newspaper 파싱은 CPU 작업이므로 스레드에서 실행
+                res = await asyncio.to_thread(self.process_article, url, html)
+                if res:
+                    summarization.submit(res)
+                    downloaded += 1
+        
+        download_elapsed = time.perf_counter() - download_started
+        new_articles = summarization.close()
+        if self.cache:
+            self.cache.put_articles(new_articles)
+        self._record_stage('download', downloaded, download_elapsed)
+        self._record_stage('summarize', summarization.count, summarization.elapsed)
+        print(f"웹 기사 {len(cached_articles) + len(new_articles)}개 (캐시 {len(cached_articles)}개, 신규 {len(new_articles)}개)")
+        return cached_articles + new_articles
 
-    def process_article(self, url):
-        """개별 기사 처리"""
+    def _record_stage(self, stage, count, elapsed):
+        """단계별 처리량(articles/s) 기록 및 출력"""
+        rate = count / elapsed if elapsed > 0 else 0.0
+        self.stage_stats[stage] = {'articles': count, 'seconds': round(elapsed, 2), 'articles_per_sec': round(rate, 2)}
+        print(f"[{stage}] {count}개 기사, {elapsed:.2f}초 ({rate:.2f} articles/s)")
+
+    def process_article(self, url, html=None):
+        """개별 기사 다운로드 및 파싱 (html 이 주어지면 다운로드 생략, 요약은 SummarizationStage 에서 배치 처리)"""
         try:
             article = Article(url)
-            article.download()
+            article.download(input_html=html)
             article.parse()
             
             if not article.text or len(article.text) < 100:
                 return None
             
-            # 요약 생성
-            summary = self.summarizer(
-                article.text[:1024], 
-                max_length=150, 
-                min_length=30, 
-                do_sample=False
-            )[0]['summary_text']
-            
             return {
                 'source': 'BBC Web',
                 'url': url,
                 'date': article.publish_date or datetime.now(),
                 'title': article.title,
                 'content': article.text,
-                'summary': summary,
+                'summary': None,
                 'raw_html': article.html
             }
         except Exception as e:
@@ -114,56 +378,69 @@ class FootballMediaAnalyzer:
 
     def analyze_sentiment(self, text):
         """텍스트 감성 분석"""
-        analysis = TextBlob(text)
-        return {
-            'polarity': analysis.sentiment.polarity,
-            'subjectivity': analysis.sentiment.subjectivity
-        }
+        return self.sentiment.analyze([text])[0]
 
     def calculate_media_scores(self, articles):
-        """팀별 미디어 점수 계산"""
-        team_articles = {team: [] for team in PREMIER_LEAGUE_TEAMS}
+        """팀별 미디어 점수 계산 (신규 기사만 지수 감쇠 누적값에 반영)"""
+        # 기사별 언급 팀 태깅 (키워드 추출에서도 재사용)
+        self.team_articles = self.matcher.build_index(articles)
         
-        for article in articles:
-            content = f"{article['title']} {article['content']}".lower()
-            for team in PREMIER_LEAGUE_TEAMS:
-                if team.lower() in content:
-                    team_articles[team].append(article)
+        # 팀이 언급된 기사의 감성 분석을 한 번에 수행 (기사당 1회, 본문 해시 캐시 사용)
+        self.sentiment.score_articles([a for a in articles if a['teams']])
+        print(f"감성 분석 캐시: 적중 {self.sentiment.hits}건, 신규 분석 {self.sentiment.misses}건")
         
-        for team, articles in team_articles.items():
-            if not articles:
-                self.team_scores[team] = 0
-                continue
-                
-            total_score = 0
-            total_weight = 0
-            
-            for article in articles:
-                # 감성 분석
-                title_sentiment = self.analyze_sentiment(article['title'])
-                content_sentiment = self.analyze_sentiment(article['content'])
-                
-                # 가중치 계산
-                days_old = (datetime.now() - article['date']).days if article['date'] else 0
-                time_weight = max(0.1, 1 - days_old/30)
-                length_weight = min(1.2, len(article['content'])/3000 + 0.8)
-                
-                # 종합 점수
-                weighted_score = (
-                    (title_sentiment['polarity'] * 0.4 + content_sentiment['polarity'] * 0.6) 
-                    * time_weight 
-                    * length_weight
-                )
-                
-                total_score += weighted_score
-                total_weight += time_weight * length_weight
-            
-            # 점수 스케일링 (-10 ~ 10)
-            avg_score = total_score / total_weight if total_weight > 0 else 0
-            self.team_scores[team] = int(round(avg_score * 10))
+        # 시간 순으로 반영해야 점수 이력이 시점별로 올바르게 쌓임
+        pending = sorted(
+            ((team, article) for team, articles in self.team_articles.items() for article in articles
+             if f"{team}|{article['url']}" not in self.aggregates.ingested),
+            key=lambda pair: to_naive(pair[1]['date'])
+        )
+        new_count = 0
+        for team, article in pending:
+            # 종합 점수 및 길이 가중치 (시간 가중치는 누적값의 지수 감쇠로 반영)
+            polarity = article['title_polarity'] * 0.4 + article['polarity'] * 0.6
+            length_weight = min(1.2, len(article['content'])/3000 + 0.8)
+            new_count += self.aggregates.ingest(team, article['url'], article['date'], polarity, length_weight)
+        
+        self.aggregates.save()
+        print(f"미디어 점수 누적값 갱신: 신규 (팀, 기사) {new_count}건")
+        
+        # 점수 스케일링 (-10 ~ 10)
+        now = datetime.now()
+        for team in PREMIER_LEAGUE_TEAMS:
+            self.team_scores[team] = int(round(self.aggregates.score(team, now) * 10))
 
     def generate_keywords(self, team_articles):
-        """팀별 키워드 추출"""
+        """팀별 키워드 추출 (코퍼스 전체 TF-IDF 1회 계산 후 팀별 기사 행 합산)"""
+        started = time.perf_counter()
+        self.keyword_index.add_documents(
+            (a['url'], f"{a['title']} {a['content']}") for articles in team_articles.values() for a in articles
+        )
+        keywords = {
+            team: self.keyword_index.top_keywords([a['url'] for a in articles])
+            for team, articles in team_articles.items()
+        }
+        self.stage_stats['keywords'] = {'seconds': round(time.perf_counter() - started, 4)}
+        return keywords
+
+    def compare_keyword_timings(self, team_articles=None):
+        """코퍼스 TF-IDF 방식과 기존 팀별 재학습 방식의 소요 시간 비교"""
+        team_articles = team_articles or self._get_team_articles()
+        
+        started = time.perf_counter()
+        self._generate_keywords_per_team(team_articles)
+        per_team = time.perf_counter() - started
+        
+        self.keyword_index = CorpusKeywordIndex()
+        started = time.perf_counter()
+        self.generate_keywords(team_articles)
+        corpus = time.perf_counter() - started
+        
+        print(f"키워드 추출 시간 - 팀별 재학습: {per_team:.3f}초, 코퍼스 TF-IDF: {corpus:.3f}초")
+        return {'per_team_refit': per_team, 'corpus_tfidf': corpus}
+
+    def _generate_keywords_per_team(self, team_articles):
+        """기존 방식: 팀마다 TfidfVectorizer 재학습 (시간 비교용)"""
         vectorizer = TfidfVectorizer(stop_words='english', max_features=50)
         keywords = {}
         
@@ -186,20 +463,25 @@ class FootballMediaAnalyzer:
 
     def run_analysis(self, max_articles=200):
         """전체 분석 프로세스 실행"""
-        print("기사 수집 시작...")
+        started = time.perf_counter()
+        print(f"기사 수집 시작... (모드: {self.mode})")
         rss_articles = self.fetch_bbc_rss_articles(100)
-        web_articles = self.scrape_bbc_web(100)
+        # scores_only 모드는 웹 기사 다운로드 / 요약을 생략
+        web_articles = self.scrape_bbc_web(100) if self.mode != "scores_only" else []
         self.articles = [a for a in rss_articles + web_articles if a][:max_articles]
         
         print(f"총 {len(self.articles)}개 기사 수집 완료")
         print("감성 분석 및 점수 계산 중...")
         
         self.calculate_media_scores(self.articles)
+        if self.cache:
+            # 감성 분석 결과까지 캐시에 반영
+            self.cache.put_articles(self.articles)
         keywords = self.generate_keywords(self._get_team_articles())
         
-        # 결과 저장
-        df = pd.DataFrame(self.articles)
-        df.to_csv('bbc_football_articles.csv', index=False)
+        # 결과 저장 (기사는 압축 저장소에 추가, 필요 시 ArticleStore.export_csv 로 CSV 내보내기)
+        added = self.store.append(self.articles, include_raw_html=self.store_raw_html)
+        print(f"기사 저장소에 {added}개 기사 추가")
         
         scores_df = pd.DataFrame([{
             'Team': team, 
@@ -210,19 +492,25 @@ class FootballMediaAnalyzer:
         scores_df.sort_values('Media Score', ascending=False, inplace=True)
         scores_df.to_csv('team_media_scores.csv', index=False)
         print("분석 완료! 결과 파일 저장됨")
+        self._report_run(time.perf_counter() - started)
+
+    def _report_run(self, elapsed):
+        """모드별 시작 시간 / 실행 시간 / 최대 메모리(RSS) 기록"""
+        # Linux 의 ru_maxrss 단위는 KB
+        peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        self.stage_stats['run'] = {'mode': self.mode, 'seconds': round(elapsed, 2), 'peak_rss_mb': round(peak_rss_mb, 1)}
+        print(f"[{self.mode}] 시작 {self.stage_stats['startup']['seconds']}초, "
+              f"실행 {elapsed:.2f}초, 최대 RSS {peak_rss_mb:.1f}MB")
 
     def _get_team_articles(self):
-        """팀별 기사 분류 (내부용)"""
-        team_articles = {team: [] for team in PREMIER_LEAGUE_TEAMS}
-        for article in self.articles:
-            content = f"{article['title']} {article['content']}".lower()
-            for team in PREMIER_LEAGUE_TEAMS:
-                if team.lower() in content:
-                    team_articles[team].append(article)
-        return team_articles
+        """팀별 기사 분류 (내부용, calculate_media_scores 에서 만든 인덱스 재사용)"""
+        if not self.team_articles:
+            self.team_articles = self.matcher.build_index(self.articles)
+        return self.team_articles
 
 if __name__ == "__main__":
-    analyzer = FootballMediaAnalyzer()
+    import sys
+    analyzer = FootballMediaAnalyzer(mode="scores_only" if "--scores-only" in sys.argv else "full")
     analyzer.run_analysis(max_articles=150)
     print("\n최종 미디어 점수:")
     print(pd.read_csv('team_media_scores.csv').to_markdown(index=False))
@@ -0,0 +1,65 @@
+# media_sentiment.py
+import hashlib
+
+from textblob import TextBlob
+
+
+def content_hash(text):
+    """감성 분석 캐시 키 (본문 SHA-1)"""
+    return hashlib.sha1((text or '').encode('utf-8')).hexdigest()
+
+
+class TextBlobSentiment:
+    """
+    기본 감성 분석 백엔드.
+    다른 백엔드는 name 속성과 analyze_batch(texts) -> [{'polarity', 'subjectivity'}] 만 구현하면 교체할 수 있습니다.
+    """
+    name = "textblob"
+
+    def analyze_batch(self, texts):
+        results = []
+        for text in texts:
+            sentiment = TextBlob(text or '').sentiment
+            results.append({'polarity': sentiment.polarity, 'subjectivity': sentiment.subjectivity})
+        return results
+
+
+class SentimentScorer:
+    """본문 해시 기준 캐시를 거쳐, 캐시에 없는 텍스트만 백엔드로 한 번에 분석"""
+
+    def __init__(self, backend=None, cache=None):
+        self.backend = backend or TextBlobSentiment()
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+
+    def analyze(self, texts):
+        hashes = [content_hash(text) for text in texts]
+        known = self.cache.get_sentiments(set(hashes), self.backend.name) if self.cache else {}
+
+        # 같은 실행 안에서 중복된 텍스트도 한 번만 분석
+        missing = {}
+        for text, key in zip(texts, hashes):
+            if key not in known and key not in missing:
+                missing[key] = text
+        if missing:
+            analyzed = dict(zip(missing, self.backend.analyze_batch(list(missing.values()))))
+            known.update(analyzed)
+            if self.cache:
+                self.cache.put_sentiments(analyzed, self.backend.name)
+
+        self.misses += len(missing)
+        self.hits += len(texts) - len(missing)
+        return [known[key] for key in hashes]
+
+    def score_articles(self, articles):
+        """감성 분석 결과가 없는 기사의 제목 / 본문을 한 번에 분석하여 기사에 저장"""
+        pending = [a for a in articles if a.get('polarity') is None or a.get('title_polarity') is None]
+        if not pending:
+            return
+        results = self.analyze([a['title'] for a in pending] + [a['content'] for a in pending])
+        for article, title_sentiment, content_sentiment in zip(pending, results[:len(pending)], results[len(pending):]):
+            article['title_polarity'] = title_sentiment['polarity']
+            article['title_subjectivity'] = title_sentiment['subjectivity']
+            article['polarity'] = content_sentiment['polarity']
+            article['subjectivity'] = content_sentiment['subjectivity']
@@ -1,40 +1,65 @@
 from flask import Flask, request, jsonify
 import pandas as pd
 import numpy as np
-import pickle
 import warnings
 import pymysql
-from scipy.stats import poisson
 import os
+import threading
+from collections import OrderedDict
+from league_registry import LeagueRegistry
+from request_profiler import init_profiling
+from markets import MARKET_TABLE_DDL, score_matrix, compute_markets, select_markets, market_rows
 
 warnings.filterwarnings("ignore")
 app = Flask(__name__)
 
-# ✅ 모델 로드
-with open('xgb_model_home.pkl', 'rb') as f:
-    model_home = pickle.load(f)
-with open('xgb_model_away.pkl', 'rb') as f:
-    model_away = pickle.load(f)
-
-# 학습 시 사용된 feature 컬럼 불러오기
-with open('trained_feature_columns.pkl', 'rb') as f:
-    trained_feature_columns = pickle.load(f)
-
-# 전체 데이터 로드
-df_full = pd.read_csv('../../data/datas/2/final/merged_final.csv')
-df_full['date'] = pd.to_datetime(df_full['date'], errors='coerce')
+# ✅ 대회별 모델 / 경기 기록 설정 (첫 요청 시 지연 로딩)
+LEAGUE_CONFIG = {
+    "epl": {
+        "model_home": 'xgb_model_home.pkl',
+        "model_away": 'xgb_model_away.pkl',
+        "feature_columns": 'trained_feature_columns.pkl',  # 학습 시 사용된 feature 컬럼
+        "history": '../../data/datas/2/final/merged_final.csv',
+        "media_history": '../team_media_score_history.csv'  # 팀별 미디어 점수 이력 (media_score.py 생성)
+    }
+}
+DEFAULT_COMPETITION = "epl"
+
+league_registry = LeagueRegistry(LEAGUE_CONFIG, idle_timeout=1800)
+
+# 🔬 요청 프로파일링 (PREMO_PROFILING=1 일 때만 훅 등록, 비활성 시 오버헤드 없음)
+if os.environ.get("PREMO_PROFILING") == "1":
+    init_profiling(
+        app,
+        profile_dir=os.environ.get("PREMO_PROFILE_DIR", "profiles"),
+        sample_rate=float(os.environ.get("PREMO_PROFILE_SAMPLE_RATE", "0")),
+        admin_token=os.environ.get("PREMO_PROFILE_TOKEN")
+    )
 
-# DB 연결 함수
+# DB 연결 함수 (부하 테스트 등에서 PREMO_DB_* 환경변수로 접속 대상 변경 가능)
 def get_db_connection():
     return pymysql.connect(
-        host="premo-instance.czwmu86ms4yl.us-east-1.rds.amazonaws.com",
-        user="admin",
-        password="tteam891",
-        db="premo",
+        host=os.environ.get("PREMO_DB_HOST", "premo-instance.czwmu86ms4yl.us-east-1.rds.amazonaws.com"),
+        port=int(os.environ.get("PREMO_DB_PORT", "3306")),
+        user=os.environ.get("PREMO_DB_USER", "admin"),
+        password=os.environ.get("PREMO_DB_PASSWORD", "tteam891"),
+        db=os.environ.get("PREMO_DB_NAME", "premo"),
         charset="utf8mb4",
         cursorclass=pymysql.cursors.DictCursor
     )
 
+# 파생 마켓 보조 테이블 생성 (프로세스당 한 번, 없을 때만)
+market_table_ready = False
+
+def ensure_market_table(conn):
+    global market_table_ready
+    if market_table_ready:
+        return
+    with conn.cursor() as cursor:
+        cursor.execute(MARKET_TABLE_DDL)
+    conn.commit()
+    market_table_ready = True
+
 # 팀 매핑 정보 초기화
 def load_team_mapping(conn):
     with conn.cursor() as cursor:
@@ -48,7 +73,7 @@ def load_team_mapping(conn):
 
 team_folder_map = {"AFC Bournemouth": "Bournemouth"}
 
-def build_input_vector(home_team_name, away_team_name, current_date, df, trained_feature_columns, N=3):
+def build_input_vector(home_team_name, away_team_name, current_date, df, trained_feature_columns, N=3, media_history=None):
     print("✅ [ENTRY] build_input_vector 함수 진입")
 
     try:
@@ -96,6 +121,12 @@ def build_input_vector(home_team_name, away_team_name, current_date, df, trained
         print(f"❌ [ERROR] 평균 벡터 계산 실패: {e}")
         raise
 
+    # 미디어 점수는 최근 경기 평균 대신 경기 시점 이전(as-of)의 최신 값 사용 (팀별 이력 배열 이진 탐색)
+    if media_history is not None:
+        base_vector['home_media_score'] = media_history.asof(home_team_name, current_date)
+        base_vector['away_media_score'] = media_history.asof(away_team_name, current_date)
+        print("📰 [STEP 3-1] 미디어 점수 as-of 조인 완료")
+
     try:
         dummy_df = pd.DataFrame({
             'home_team_name': [home_team_name],
@@ -266,45 +297,120 @@ def build_input_vector(home_team_name, away_team_name, current_date, df, trained
 
 
 # Poisson 예측 함수
-def predict_scores_with_prob(input_vector, max_goal=5, top_k=3):
-    mu_home = model_home.predict(input_vector)[0]
-    mu_away = model_away.predict(input_vector)[0]
-
-    result = []
-    home_win_prob, draw_prob, away_win_prob, rest_prob = 0, 0, 0, 0
-
-    for h in range(max_goal + 1):
-        for a in range(max_goal + 1):
-            p = poisson.pmf(h, mu_home) * poisson.pmf(a, mu_away)
-            result.append(((h, a), p))
-            if h > a:
-                home_win_prob += p
-            elif h == a:
-                draw_prob += p
-            else:
-                away_win_prob += p
-
-    for h in range(max_goal + 1):
-        rest_prob += poisson.pmf(h, mu_home) * (1 - poisson.cdf(max_goal, mu_away))
-        rest_prob += (1 - poisson.cdf(max_goal, mu_home)) * poisson.pmf(h, mu_away)
-    rest_prob -= (1 - poisson.cdf(max_goal, mu_home)) * (1 - poisson.cdf(max_goal, mu_away))
-
-    result.append((("5+", "5+"), rest_prob))
-
-    total = home_win_prob + draw_prob + away_win_prob
-    home_win_prob /= total
-    draw_prob /= total
-    away_win_prob /= total
+# 승/무/패, 상위 스코어, 파생 마켓 모두 같은 스코어 행렬 하나에서 계산 (응답 내 확률 일관성 유지)
+def predict_scores_with_prob(input_vector, max_goal=10, top_k=3, league=None):
+    league = league or league_registry.get(DEFAULT_COMPETITION)
+    mu_home = league["model_home"].predict(input_vector)[0]
+    mu_away = league["model_away"].predict(input_vector)[0]
+
+    matrix = score_matrix(mu_home, mu_away, max_goal=max_goal)
+    markets = compute_markets(matrix)
+
+    flat = matrix.ravel()
+    top_idx = np.argsort(flat)[::-1][:top_k]
+    top_predictions = [
+        ((int(i // (max_goal + 1)), int(i % (max_goal + 1))), float(flat[i]))
+        for i in top_idx
+    ]
 
     return {
         "home_expected_goals": round(mu_home, 3),
         "away_expected_goals": round(mu_away, 3),
-        "top_predictions": sorted(result, key=lambda x: x[1], reverse=True)[:top_k],
-        "home_win_prob": round(home_win_prob, 4),
-        "draw_prob": round(draw_prob, 4),
-        "away_win_prob": round(away_win_prob, 4)
+        "top_predictions": top_predictions,
+        "home_win_prob": markets["result"]["home"],
+        "draw_prob": markets["result"]["draw"],
+        "away_win_prob": markets["result"]["away"],
+        "markets": markets
     }
 
+# 여러 경기의 파생 마켓을 한 번에 계산 (모델 호출 1회 + 스코어 행렬 배치 연산)
+def predict_markets_batch(input_vectors, league=None):
+    league = league or league_registry.get(DEFAULT_COMPETITION)
+    mu_home = league["model_home"].predict(input_vectors)
+    mu_away = league["model_away"].predict(input_vectors)
+    markets = compute_markets(score_matrix(mu_home, mu_away))
+    return [select_markets(markets, i) for i in range(len(input_vectors))]
+
+# ⚡ 인플레이(경기 중) 예측
+# 경기별 프리매치 Poisson 기대 득점 캐시: (대회, 홈팀, 어웨이팀, 날짜) -> (mu_home, mu_away)
+# 라이브 업데이트마다 입력 벡터 생성이나 모델 호출을 다시 하지 않기 위해 사용 (최근 사용 순 PREMATCH_CACHE_SIZE 개 유지)
+PREMATCH_CACHE_SIZE = 1024
+prematch_rate_cache = OrderedDict()
+prematch_rate_lock = threading.Lock()
+
+def get_prematch_rates(home_team_name, away_team_name, match_date, competition=DEFAULT_COMPETITION):
+    """경기별 프리매치 기대 득점(mu)을 계산하고 캐시합니다."""
+    key = (competition, home_team_name, away_team_name, pd.to_datetime(match_date).strftime("%Y-%m-%d"))
+    with prematch_rate_lock:
+        if key in prematch_rate_cache:
+            prematch_rate_cache.move_to_end(key)
+            return prematch_rate_cache[key]
+
+    league = league_registry.get(competition)
+    input_vector = build_input_vector(
+        home_team_name, away_team_name, match_date, league["df_full"], league["trained_feature_columns"],
+        media_history=league["media_history"]
+    )
+    rates = (float(league["model_home"].predict(input_vector)[0]), float(league["model_away"].predict(input_vector)[0]))
+    with prematch_rate_lock:
+        prematch_rate_cache[key] = rates
+        prematch_rate_cache.move_to_end(key)
+        while len(prematch_rate_cache) > PREMATCH_CACHE_SIZE:
+            prematch_rate_cache.popitem(last=False)
+    return rates
+
+def predict_live_scores_with_prob(mu_home, mu_away, home_score, away_score, minute,
+                                  match_length=90, max_goal=10, top_k=3):
+    """
+    현재 스코어와 경과 시간을 반영한 인플레이 예측.
+    프리매치 기대 득점을 남은 시간 비율로 줄이고, 남은 득점 분포 행렬을 현재 스코어만큼 이동시켜
+    최종 스코어 및 승/무/패 확률을 벡터 연산으로 계산합니다.
+    남은 득점 행렬은 /predict 와 같은 markets.score_matrix 로 만들어 0분 시점 결과가 프리매치 예측과 일치합니다.
+    """
+    remaining = max(0.0, min(1.0, (match_length - float(minute)) / match_length))
+    lam_home = mu_home * remaining
+    lam_away = mu_away * remaining
+
+    goals = np.arange(max_goal + 1)
+    # 남은 시간 동안의 추가 득점 확률 행렬 (행: 홈, 열: 어웨이)
+    prob_matrix = score_matrix(lam_home, lam_away, max_goal=max_goal)
+
+    # 최종 골득실 = 현재 골득실 + 추가 득점 차이
+    final_diff = (home_score - away_score) + np.subtract.outer(goals, goals)
+    home_win_prob = prob_matrix[final_diff > 0].sum()
+    draw_prob = prob_matrix[final_diff == 0].sum()
+    away_win_prob = prob_matrix[final_diff < 0].sum()
+
+    flat = prob_matrix.ravel()
+    top_idx = np.argsort(flat)[::-1][:top_k]
+    top_predictions = [
+        ((int(home_score + i // (max_goal + 1)), int(away_score + i % (max_goal + 1))), float(flat[i]))
+        for i in top_idx
+    ]
+
+    return {
+        "minute": minute,
+        "current_score": (int(home_score), int(away_score)),
+        "home_expected_goals": round(home_score + lam_home, 3),
+        "away_expected_goals": round(away_score + lam_away, 3),
+        "top_predictions": top_predictions,
+        "home_win_prob": round(float(home_win_prob), 4),
+        "draw_prob": round(float(draw_prob), 4),
+        "away_win_prob": round(float(away_win_prob), 4)
+    }
+
+# 🔁 numpy 타입을 Python 기본 타입으로 변환
+def convert(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, tuple):
+        return tuple(convert(i) for i in obj)
+    if isinstance(obj, list):
+        return [convert(i) for i in obj]
+    if isinstance(obj, dict):
+        return {k: convert(v) for k, v in obj.items()}
+    return obj
+
 def insert_prediction_to_db(
     conn, match_date, home_team_name, away_team_name, prediction_result, team_name_to_id, team_folder_map={}
 ):
@@ -365,6 +471,22 @@ def insert_prediction_to_db(
         cursor.execute(insert_sql, insert_data)
         conn.commit()
 
+        # 파생 마켓은 model_output_market 보조 테이블에 따로 저장 (실패해도 model_output 행은 유지)
+        if "markets" in prediction_result:
+            try:
+                ensure_market_table(conn)
+                cursor.executemany("""
+                    REPLACE INTO model_output_market (match_id, market, line, selection, prob, created_at)
+                    VALUES (%s, %s, %s, %s, %s, NOW())
+                """, [
+                    (match_id, market, line, selection, round(prob * 100, 2))
+                    for market, line, selection, prob in market_rows(prediction_result["markets"])
+                ])
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                print(f"⚠️ 파생 마켓 저장 실패 (match_id={match_id}): {e}")
+
         print(f"✅ DB 저장 완료: {home_team_name} vs {away_team_name} on {match_date}")
 
 # API 엔드포인트
@@ -374,30 +496,26 @@ def predict():
     home_team = data.get("home_team")
     away_team = data.get("away_team")
     match_date = data.get("match_date")
+    competition = data.get("competition", DEFAULT_COMPETITION)
 
     if not home_team or not away_team or not match_date:
         return jsonify({"error": "Missing required fields"}), 400
+    if competition not in league_registry:
+        return jsonify({"error": f"Unknown competition: {competition}"}), 400
 
     try:
-        input_vector = build_input_vector(home_team, away_team, match_date, df_full, trained_feature_columns)
-        prediction_result = predict_scores_with_prob(input_vector)
-
-        # 🔁 numpy 타입을 Python 기본 타입으로 변환
-        def convert(obj):
-            if isinstance(obj, np.generic):
-                return obj.item()
-            if isinstance(obj, tuple):
-                return tuple(convert(i) for i in obj)
-            if isinstance(obj, list):
-                return [convert(i) for i in obj]
-            if isinstance(obj, dict):
-                return {k: convert(v) for k, v in obj.items()}
-            return obj
+        league = league_registry.get(competition)
+        input_vector = build_input_vector(
+            home_team, away_team, match_date, league["df_full"], league["trained_feature_columns"],
+            media_history=league["media_history"]
+        )
+        prediction_result = predict_scores_with_prob(input_vector, league=league)
 
         clean_result = convert(prediction_result)
 
         return jsonify({
             "success": True,
+            "competition": competition,
             "home_team": home_team,
             "away_team": away_team,
             "match_date": match_date,
@@ -407,7 +525,43 @@ def predict():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+# 인플레이 예측 엔드포인트 (현재 스코어 + 경과 시간)
+@app.route('/predict/live', methods=['POST'])
+def predict_live():
+    data = request.json
+    home_team = data.get("home_team")
+    away_team = data.get("away_team")
+    match_date = data.get("match_date")
+    minute = data.get("minute")
+    competition = data.get("competition", DEFAULT_COMPETITION)
+
+    if not home_team or not away_team or not match_date or minute is None:
+        return jsonify({"error": "Missing required fields"}), 400
+    if competition not in league_registry:
+        return jsonify({"error": f"Unknown competition: {competition}"}), 400
+
+    try:
+        mu_home, mu_away = get_prematch_rates(home_team, away_team, match_date, competition)
+        prediction_result = predict_live_scores_with_prob(
+            mu_home, mu_away,
+            int(data.get("home_score", 0)), int(data.get("away_score", 0)),
+            float(minute)
+        )
+
+        return jsonify({
+            "success": True,
+            "competition": competition,
+            "home_team": home_team,
+            "away_team": away_team,
+            "match_date": match_date,
+            **convert(prediction_result)
+        })
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 # 서버 실행
 if __name__ == '__main__':
     print("\u26a1\ufe0f 서버 실행 중...")
+    league_registry.start_reaper(interval=60)
     app.run(host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,103 @@
+import pickle
+import threading
+import time
+
+import pandas as pd
+
+from media_history import MediaScoreHistory
+
+
+class LeagueRegistry:
+    """
+    대회(competition) id -> 모델 번들 / 경기 기록 매핑.
+    각 리그는 첫 요청 시 지연 로딩되고, idle_timeout 동안 사용되지 않으면 메모리에서 해제됩니다.
+    설정된 리그 수가 아니라 실제로 사용 중인 리그 수만큼만 메모리를 사용합니다.
+    """
+
+    def __init__(self, league_config, idle_timeout=1800):
+        # league_config: {competition_id: {"model_home", "model_away", "feature_columns", "history", "media_history"(선택)}}
+        self.league_config = league_config
+        self.idle_timeout = idle_timeout
+        self._bundles = {}
+        self._last_used = {}
+        self._locks = {competition: threading.Lock() for competition in league_config}
+        self._registry_lock = threading.Lock()
+        self._reaper = None
+
+    def __contains__(self, competition):
+        return competition in self.league_config
+
+    def loaded(self):
+        """현재 메모리에 올라와 있는 리그 목록"""
+        return list(self._bundles)
+
+    def _load_bundle(self, competition):
+        config = self.league_config[competition]
+        started = time.time()
+
+        with open(config["model_home"], 'rb') as f:
+            model_home = pickle.load(f)
+        with open(config["model_away"], 'rb') as f:
+            model_away = pickle.load(f)
+        with open(config["feature_columns"], 'rb') as f:
+            trained_feature_columns = pickle.load(f)
+
+        df_full = pd.read_csv(config["history"])
+        df_full['date'] = pd.to_datetime(df_full['date'], errors='coerce')
+
+        # 팀별 미디어 점수 이력 (build_input_vector 에서 경기 시점 기준 as-of 조회)
+        media_history = None
+        if config.get("media_history"):
+            media_history = MediaScoreHistory.from_csv(config["media_history"])
+
+        print(f"📦 [{competition}] 리그 번들 로드 완료 ({time.time() - started:.2f}초)")
+        return {
+            "competition": competition,
+            "model_home": model_home,
+            "model_away": model_away,
+            "trained_feature_columns": trained_feature_columns,
+            "df_full": df_full,
+            "media_history": media_history
+        }
+
+    def get(self, competition):
+        """리그 번들 조회 (미로드 시 로드)"""
+        if competition not in self.league_config:
+            raise KeyError(f"등록되지 않은 대회: {competition}")
+
+        self.evict_idle()
+
+        bundle = self._bundles.get(competition)
+        if bundle is None:
+            # 같은 리그에 대한 동시 첫 요청은 한 번만 로드
+            with self._locks[competition]:
+                bundle = self._bundles.get(competition)
+                if bundle is None:
+                    bundle = self._load_bundle(competition)
+                    self._bundles[competition] = bundle
+
+        self._last_used[competition] = time.time()
+        return bundle
+
+    def evict_idle(self):
+        """idle_timeout 이상 사용되지 않은 리그 해제"""
+        now = time.time()
+        with self._registry_lock:
+            for competition in list(self._bundles):
+                if now - self._last_used.get(competition, now) > self.idle_timeout:
+                    self._bundles.pop(competition, None)
+                    self._last_used.pop(competition, None)
+                    print(f"🧹 [{competition}] 유휴 리그 번들 해제")
+
+    def start_reaper(self, interval=60):
+        """요청이 없을 때도 유휴 리그가 해제되도록 백그라운드 스레드 시작"""
+        if self._reaper is not None:
+            return
+
+        def reap():
+            while True:
+                time.sleep(interval)
+                self.evict_idle()
+
+        self._reaper = threading.Thread(target=reap, daemon=True)
+        self._reaper.start()
@@ -0,0 +1,307 @@
+"""
+inference.py 부하 테스트 하네스.
+
+운영 RDS 대신 로컬 MySQL(--db mysql) 또는 프로세스 내 SQLite 대체 DB(--db standin)에
+합성 team / match / model_output 테이블을 만들고, 앱을 로컬에서 띄운 뒤 동시성 단계별로 /predict, /predict/live 를
+요청하여 처리량 / 지연시간 곡선을 CSV 로 저장합니다.
+/predict 와 /predict/live 는 DB 를 읽지 않으므로, DB 경로는 save 요청(예측 후 insert_prediction_to_db 로 저장하는
+하네스 전용 엔드포인트 /loadtest/save)으로 측정합니다.
+
+--db mysql 은 합성 테이블을 만들기 전에 기존 행을 모두 지우므로, 이름에 "loadtest" 가 들어간 전용 스키마에
+--reset 을 함께 줄 때만 실행됩니다.
+
+사용 예 (models/service 디렉터리에서 실행):
+    python loadtest.py --db standin --concurrency 1,2,4,8,16 --requests 200 --mix predict=0.7,live=0.2,save=0.1
+    python loadtest.py --db mysql --db-name premo_loadtest --reset
+"""
+import argparse
+import os
+import random
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import requests
+from flask import jsonify, request
+from werkzeug.serving import make_server
+
+from markets import MARKET_TABLE_DDL
+
+
+SYNTHETIC_TABLES = [
+    "CREATE TABLE IF NOT EXISTS team (team_id INT PRIMARY KEY, team_common_name VARCHAR(100), short_name VARCHAR(100))",
+    "CREATE TABLE IF NOT EXISTS `match` (match_id INT PRIMARY KEY, home_team_id INT, away_team_id INT, start_time VARCHAR(20))",
+    """CREATE TABLE IF NOT EXISTS model_output (
+        match_id INT,
+        home_winrate DECIMAL(6, 2), drawrate DECIMAL(6, 2), away_winrate DECIMAL(6, 2),
+        home_score_1 INT, away_score_1 INT, score_1_prob DECIMAL(6, 2),
+        home_score_2 INT, away_score_2 INT, score_2_prob DECIMAL(6, 2),
+        home_score_3 INT, away_score_3 INT, score_3_prob DECIMAL(6, 2),
+        prediction_date DATETIME, created_at DATETIME, updated_at DATETIME
+    )""",
+    MARKET_TABLE_DDL,
+]
+
+
+class StandInConnection:
+    """
+    pymysql(DictCursor) 인터페이스를 흉내내는 SQLite 대체 DB.
+    요청 스레드마다 같은 DB 파일에 대한 별도 연결을 사용하므로 commit / rollback 이 서로 섞이지 않습니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+
+    @property
+    def conn(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.row_factory = lambda cursor, row: {col[0]: row[i] for i, col in enumerate(cursor.description)}
+            conn.execute("PRAGMA journal_mode=WAL")
+            self.local.conn = conn
+        return conn
+
+    def cursor(self):
+        return StandInCursor(self.conn.cursor())
+
+    def commit(self):
+        self.conn.commit()
+
+    def rollback(self):
+        self.conn.rollback()
+
+    def close(self):
+        pass
+
+
+class StandInCursor:
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cursor.close()
+
+    @staticmethod
+    def _translate(sql):
+        # MySQL 파라미터 / 함수 표기를 SQLite 문법으로 변환
+        sql = re.sub(r"%\((\w+)\)s", r":\1", sql).replace("%s", "?")
+        return sql.replace("NOW()", "CURRENT_TIMESTAMP")
+
+    def execute(self, sql, params=None):
+        return self.cursor.execute(self._translate(sql), params or ())
+
+    def executemany(self, sql, seq_of_params):
+        return self.cursor.executemany(self._translate(sql), seq_of_params)
+
+    def fetchone(self):
+        return self.cursor.fetchone()
+
+    def fetchall(self):
+        return self.cursor.fetchall()
+
+
+def sample_fixtures(df_full, n_fixtures, seed=42):
+    """경기 기록에서 예측 가능한(양 팀의 과거 경기가 있는) 경기 샘플링"""
+    df = df_full.dropna(subset=['date']).sort_values('date')
+    candidates = df.iloc[len(df) // 2:][['home_team_name', 'away_team_name', 'date']]
+    sampled = candidates.sample(min(n_fixtures, len(candidates)), random_state=seed)
+    return [
+        {"home_team": r.home_team_name, "away_team": r.away_team_name, "match_date": r.date.strftime("%Y-%m-%d")}
+        for r in sampled.itertuples()
+    ]
+
+
+def seed_synthetic_tables(conn, df_full, fixtures):
+    """합성 team / match / model_output / model_output_market 테이블 생성 (기존 행은 삭제, main 의 --reset 확인 필요)"""
+    teams = sorted(set(df_full['home_team_name']) | set(df_full['away_team_name']))
+    team_ids = {name: i + 1 for i, name in enumerate(teams)}
+    with conn.cursor() as cursor:
+        for ddl in SYNTHETIC_TABLES:
+            cursor.execute(ddl)
+        cursor.execute("DELETE FROM team")
+        cursor.execute("DELETE FROM `match`")
+        cursor.execute("DELETE FROM model_output")
+        cursor.execute("DELETE FROM model_output_market")
+        for name, team_id in team_ids.items():
+            cursor.execute(
+                "INSERT INTO team (team_id, team_common_name, short_name) VALUES (%s, %s, %s)",
+                (team_id, name, name)
+            )
+        for match_id, fixture in enumerate(fixtures, 1):
+            cursor.execute(
+                "INSERT INTO `match` (match_id, home_team_id, away_team_id, start_time) VALUES (%s, %s, %s, %s)",
+                (match_id, team_ids[fixture['home_team']], team_ids[fixture['away_team']], fixture['match_date'])
+            )
+    conn.commit()
+    print(f"🗄️ 합성 테이블 생성 완료 - team: {len(team_ids)}, match: {len(fixtures)}")
+
+
+def register_save_route(inference, team_name_to_id):
+    """예측 결과를 insert_prediction_to_db 로 저장하는 하네스 전용 엔드포인트 (DB 쓰기 경로 측정용)"""
+    @inference.app.route('/loadtest/save', methods=['POST'])
+    def loadtest_save():
+        data = request.json
+        league = inference.league_registry.get(inference.DEFAULT_COMPETITION)
+        input_vector = inference.build_input_vector(
+            data["home_team"], data["away_team"], data["match_date"], league["df_full"],
+            league["trained_feature_columns"], media_history=league["media_history"]
+        )
+        prediction_result = inference.predict_scores_with_prob(input_vector, league=league)
+        conn = inference.get_db_connection()
+        try:
+            inference.insert_prediction_to_db(
+                conn, data["match_date"], data["home_team"], data["away_team"],
+                prediction_result, team_name_to_id, inference.team_folder_map
+            )
+        finally:
+            conn.close()
+        return jsonify({"success": True})
+
+
+def parse_mix(mix):
+    weights = {}
+    for part in mix.split(','):
+        name, weight = part.split('=')
+        weights[name.strip()] = float(weight)
+    return weights
+
+
+def build_payload(kind, fixture, rng):
+    if kind == "live":
+        return "/predict/live", {
+            **fixture,
+            "minute": rng.randint(1, 90),
+            "home_score": rng.randint(0, 3),
+            "away_score": rng.randint(0, 3)
+        }
+    if kind == "save":
+        return "/loadtest/save", dict(fixture)
+    return "/predict", dict(fixture)
+
+
+def run_level(base_url, fixtures, mix, concurrency, n_requests, seed):
+    """단일 동시성 단계 실행 -> 처리량 / 지연시간 통계"""
+    rng = random.Random(seed + concurrency)
+    kinds = rng.choices(list(mix), weights=list(mix.values()), k=n_requests)
+    jobs = [build_payload(kind, rng.choice(fixtures), rng) for kind in kinds]
+    session = requests.Session()
+    session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=concurrency))
+
+    def call(job):
+        path, payload = job
+        started = time.perf_counter()
+        response = session.post(f"{base_url}{path}", json=payload, timeout=60)
+        return time.perf_counter() - started, response.status_code
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(call, jobs))
+    wall = time.perf_counter() - started
+
+    latencies = np.array([r[0] for r in results]) * 1000
+    errors = sum(1 for r in results if r[1] != 200)
+    return {
+        "concurrency": concurrency,
+        "requests": n_requests,
+        "errors": errors,
+        "throughput_rps": round(n_requests / wall, 2),
+        "p50_ms": round(float(np.percentile(latencies, 50)), 2),
+        "p95_ms": round(float(np.percentile(latencies, 95)), 2),
+        "p99_ms": round(float(np.percentile(latencies, 99)), 2),
+        "max_ms": round(float(latencies.max()), 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PREMO 예측 서비스 부하 테스트")
+    parser.add_argument("--db", choices=["standin", "mysql"], default="standin")
+    parser.add_argument("--db-host", default="127.0.0.1")
+    parser.add_argument("--db-port", default="3306")
+    parser.add_argument("--db-user", default="root")
+    parser.add_argument("--db-password", default="")
+    parser.add_argument("--db-name", default="premo_loadtest", help="--db mysql 대상 스키마 (이름에 loadtest 포함 필수)")
+    parser.add_argument("--reset", action="store_true", help="--db mysql 스키마의 team / match / model_output 행 삭제 허용")
+    parser.add_argument("--concurrency", default="1,2,4,8,16")
+    parser.add_argument("--requests", type=int, default=200, help="동시성 단계별 요청 수")
+    parser.add_argument("--mix", default="predict=0.7,live=0.2,save=0.1",
+                        help="요청 종류별 비율 (predict / live / save)")
+    parser.add_argument("--fixtures", type=int, default=50)
+    parser.add_argument("--port", type=int, default=5055)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="loadtest_results.csv")
+    parser.add_argument("--plot", action="store_true", help="처리량/지연시간 곡선 PNG 저장 (matplotlib 필요)")
+    args = parser.parse_args()
+
+    if args.db == "mysql":
+        # 운영 스키마를 지우지 않도록 전용 부하 테스트 스키마 + 명시적 --reset 일 때만 진행
+        if "loadtest" not in args.db_name.lower():
+            parser.error(f"--db-name '{args.db_name}' 은 부하 테스트 전용 스키마가 아닙니다 (이름에 loadtest 포함 필요)")
+        if not args.reset:
+            parser.error(f"--db mysql 은 '{args.db_name}' 의 기존 행을 삭제합니다. 확인했다면 --reset 을 함께 지정하세요")
+        # 앱 임포트 전에 접속 대상을 로컬 MySQL 로 변경
+        os.environ.update({
+            "PREMO_DB_HOST": args.db_host, "PREMO_DB_PORT": args.db_port,
+            "PREMO_DB_USER": args.db_user, "PREMO_DB_PASSWORD": args.db_password,
+            "PREMO_DB_NAME": args.db_name
+        })
+
+    import inference
+
+    if args.db == "standin":
+        standin = StandInConnection(os.path.join(tempfile.mkdtemp(), "standin.sqlite"))
+        inference.get_db_connection = lambda: standin
+
+    league = inference.league_registry.get(inference.DEFAULT_COMPETITION)
+    fixtures = sample_fixtures(league["df_full"], args.fixtures, args.seed)
+    conn = inference.get_db_connection()
+    seed_synthetic_tables(conn, league["df_full"], fixtures)
+    team_name_to_id = inference.load_team_mapping(conn)
+    conn.close()
+    register_save_route(inference, team_name_to_id)
+
+    server = make_server("127.0.0.1", args.port, inference.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{args.port}"
+    print(f"🚀 테스트 서버 실행: {base_url}")
+
+    mix = parse_mix(args.mix)
+    # 워밍업: 모델 / 프리매치 캐시 로드 시간을 측정에서 제외
+    run_level(base_url, fixtures, mix, 1, min(len(fixtures), 20), args.seed)
+
+    rows = []
+    for concurrency in [int(c) for c in args.concurrency.split(',')]:
+        row = run_level(base_url, fixtures, mix, concurrency, args.requests, args.seed)
+        rows.append(row)
+        print(f"📈 동시성 {concurrency}: {row['throughput_rps']} req/s, "
+              f"p50 {row['p50_ms']}ms, p95 {row['p95_ms']}ms, 오류 {row['errors']}")
+    server.shutdown()
+
+    result_df = pd.DataFrame(rows)
+    result_df.to_csv(args.output, index=False)
+    print(f"✅ 결과 저장: {args.output}")
+
+    if args.plot:
+        import matplotlib.pyplot as plt
+        fig, ax1 = plt.subplots()
+        ax1.plot(result_df['concurrency'], result_df['throughput_rps'], marker='o', label='throughput (req/s)')
+        ax1.set_xlabel('concurrency')
+        ax1.set_ylabel('req/s')
+        ax2 = ax1.twinx()
+        ax2.plot(result_df['concurrency'], result_df['p95_ms'], marker='s', color='tab:red', label='p95 (ms)')
+        ax2.set_ylabel('p95 latency (ms)')
+        fig.tight_layout()
+        fig.savefig(os.path.splitext(args.output)[0] + '.png')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import numpy as np
+from scipy.stats import poisson
+
+# 파생 마켓 라인 설정
+OVER_UNDER_LINES = [0.5, 1.5, 2.5, 3.5, 4.5]
+ASIAN_HANDICAP_LINES = [-2.5, -2.0, -1.5, -1.0, -0.5, 0.0, 0.5, 1.0, 1.5, 2.0, 2.5]  # 홈팀 기준 핸디캡
+MAX_GOAL_DIFF = 3
+
+# 파생 마켓 저장용 보조 테이블 (model_output 과 match_id 로 연결)
+MARKET_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS model_output_market (
+    match_id INT NOT NULL,
+    market VARCHAR(32) NOT NULL,
+    line VARCHAR(16) NOT NULL,
+    selection VARCHAR(16) NOT NULL,
+    prob DECIMAL(6, 2) NOT NULL,
+    created_at DATETIME NOT NULL,
+    PRIMARY KEY (match_id, market, line, selection)
+)
+"""
+
+
+def score_matrix(mu_home, mu_away, max_goal=10):
+    """
+    홈 x 어웨이 Poisson 스코어 확률 행렬.
+    mu 가 스칼라면 (G, G), 배열이면 (B, G, G) 를 반환합니다.
+    """
+    scalar = np.ndim(mu_home) == 0
+    mu_home = np.atleast_1d(np.asarray(mu_home, dtype=float))[:, None]
+    mu_away = np.atleast_1d(np.asarray(mu_away, dtype=float))[:, None]
+    goals = np.arange(max_goal + 1)[None, :]
+
+    matrix = poisson.pmf(goals, mu_home)[:, :, None] * poisson.pmf(goals, mu_away)[:, None, :]
+    # max_goal 초과 꼬리 확률은 행렬 내부에 재분배
+    matrix /= matrix.sum(axis=(1, 2), keepdims=True)
+    return matrix[0] if scalar else matrix
+
+
+def compute_markets(matrix):
+    """
+    스코어 행렬 한 번의 벡터 연산으로 파생 마켓 확률 계산.
+    (G, G) 입력이면 float, (B, G, G) 입력이면 길이 B 배열을 값으로 갖는 dict 를 반환합니다.
+    """
+    batch = matrix.ndim == 3
+    m = matrix if batch else matrix[None]
+    n_goals = m.shape[-1]
+    goals = np.arange(n_goals)
+
+    # 총 득점 / 골득실 분포 (B, T), (B, D)
+    total_index = (goals[:, None] + goals[None, :]).ravel()
+    diff_index = (goals[:, None] - goals[None, :]).ravel() + (n_goals - 1)
+    flat = m.reshape(len(m), -1)
+    total_dist = np.zeros((len(m), 2 * n_goals - 1))
+    diff_dist = np.zeros((len(m), 2 * n_goals - 1))
+    np.add.at(total_dist.T, total_index, flat.T)
+    np.add.at(diff_dist.T, diff_index, flat.T)
+    diffs = np.arange(-(n_goals - 1), n_goals)
+    totals = np.arange(2 * n_goals - 1)
+
+    markets = {
+        "result": {
+            "home": diff_dist[:, diffs > 0].sum(axis=1),
+            "draw": diff_dist[:, diffs == 0].sum(axis=1),
+            "away": diff_dist[:, diffs < 0].sum(axis=1)
+        },
+        "over_under": {},
+        "btts": {
+            "yes": m[:, 1:, 1:].sum(axis=(1, 2))
+        },
+        "clean_sheet": {
+            "home": m[:, :, 0].sum(axis=1),
+            "away": m[:, 0, :].sum(axis=1)
+        },
+        "asian_handicap": {},
+        "goal_difference": {}
+    }
+    markets["btts"]["no"] = 1 - markets["btts"]["yes"]
+
+    for line in OVER_UNDER_LINES:
+        over = total_dist[:, totals > line].sum(axis=1)
+        markets["over_under"][str(line)] = {"over": over, "under": 1 - over}
+
+    for line in ASIAN_HANDICAP_LINES:
+        adjusted = diffs + line
+        markets["asian_handicap"][f"{line:+.1f}"] = {
+            "home": diff_dist[:, adjusted > 0].sum(axis=1),
+            "push": diff_dist[:, adjusted == 0].sum(axis=1),
+            "away": diff_dist[:, adjusted < 0].sum(axis=1)
+        }
+
+    goal_difference = markets["goal_difference"]
+    goal_difference[f"<=-{MAX_GOAL_DIFF + 1}"] = diff_dist[:, diffs <= -(MAX_GOAL_DIFF + 1)].sum(axis=1)
+    for d in range(-MAX_GOAL_DIFF, MAX_GOAL_DIFF + 1):
+        goal_difference[f"{d:+d}" if d else "0"] = diff_dist[:, diffs == d].sum(axis=1)
+    goal_difference[f">=+{MAX_GOAL_DIFF + 1}"] = diff_dist[:, diffs >= MAX_GOAL_DIFF + 1].sum(axis=1)
+
+    if batch:
+        return markets
+    return _map_leaves(markets, lambda v: round(float(v[0]), 4))
+
+
+def _map_leaves(tree, func):
+    if isinstance(tree, dict):
+        return {k: _map_leaves(v, func) for k, v in tree.items()}
+    return func(tree)
+
+
+def select_markets(markets, index):
+    """배치 결과에서 index 번째 경기의 마켓만 추출"""
+    return _map_leaves(markets, lambda v: round(float(v[index]), 4))
+
+
+def market_rows(markets):
+    """DB 저장용 (market, line, selection, prob) 행 목록으로 평탄화"""
+    rows = []
+    for market, entries in markets.items():
+        for key, value in entries.items():
+            if isinstance(value, dict):
+                for selection, prob in value.items():
+                    rows.append((market, key, selection, prob))
+            else:
+                rows.append((market, "-", key, value))
+    return rows
@@ -0,0 +1,82 @@
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+# 미디어 분석(media_score.py) 팀명 -> 경기 데이터 팀명
+MEDIA_TO_MATCH_TEAM = {"Brighton": "Brighton & Hove Albion"}
+
+
+class MediaScoreHistory:
+    """
+    팀별 시간 인덱스 미디어 점수 이력 (team_media_score_history.csv).
+    팀마다 정렬된 (시각, 점수, 누적 가중치) 배열을 미리 만들어 두고, 경기 시각 이전(as-of)의 가장 최근 기록을 조회한 뒤
+    경기 시각까지 TeamMediaAggregates 와 같은 반감기 감쇠를 적용합니다 (기사가 없던 기간만큼 점수가 0 쪽으로 줄어듦).
+    경기 시각과 같거나 이후의 기록은 사용하지 않으므로 미래 정보가 섞이지 않습니다.
+    half_life_days / prior_weight 는 TeamMediaAggregates 설정과 같아야 하며, weight 컬럼이 없는 이전 이력은 가중치 1.0 으로 간주합니다.
+    """
+
+    def __init__(self, history_df, half_life_days=10.0, prior_weight=0.5):
+        self.tau = half_life_days / math.log(2)
+        self.prior_weight = prior_weight
+        history_df = history_df.copy()
+        if 'weight' not in history_df.columns:
+            history_df['weight'] = 1.0
+        history_df['weight'] = history_df['weight'].fillna(1.0)
+        history_df['team'] = history_df['team'].replace(MEDIA_TO_MATCH_TEAM)
+        # 마이크로초 유무가 섞인 ISO 문자열도 모두 파싱되도록 형식을 고정 (형식 추론은 첫 행 기준)
+        history_df['date'] = pd.to_datetime(history_df['date'], format='ISO8601', errors='coerce')
+        history_df = history_df.dropna(subset=['date']).sort_values('date')
+        self.history_df = history_df
+        self.arrays = {
+            team: (group['date'].values.astype('datetime64[ns]'), group['media_score'].values.astype(float),
+                   group['weight'].values.astype(float))
+            for team, group in history_df.groupby('team')
+        }
+
+    @classmethod
+    def from_csv(cls, path, **kwargs):
+        if not path or not os.path.exists(path):
+            return cls(pd.DataFrame(columns=['team', 'date', 'media_score', 'weight']), **kwargs)
+        return cls(pd.read_csv(path), **kwargs)
+
+    def _decayed(self, scores, weights, elapsed):
+        """기록 시점 점수를 elapsed(timedelta64) 만큼 감쇠 (TeamMediaAggregates.score 와 같은 식)"""
+        decay = np.exp(-(elapsed / np.timedelta64(1, 's')) / 86400 / self.tau)
+        return scores * (weights + self.prior_weight) * decay / (weights * decay + self.prior_weight)
+
+    def asof(self, team, date, default=0.0):
+        """date 이전의 가장 최근 점수를 date 시점까지 감쇠한 값 (없으면 default)"""
+        if team not in self.arrays:
+            return default
+        dates, scores, weights = self.arrays[team]
+        at = np.datetime64(pd.to_datetime(date), 'ns')
+        idx = np.searchsorted(dates, at, side='left') - 1
+        if idx < 0:
+            return default
+        return float(self._decayed(scores[idx], weights[idx], at - dates[idx]))
+
+    def join(self, df, date_col='date', default=0.0):
+        """경기 데이터에 home_media_score / away_media_score 컬럼을 as-of 조인"""
+        df = df.copy()
+        dates = pd.to_datetime(df[date_col], errors='coerce').values.astype('datetime64[ns]')
+        for side in ['home', 'away']:
+            values = np.full(len(df), default, dtype=float)
+            teams = df[f'{side}_team_name'].values
+            for team, (team_dates, team_scores, team_weights) in self.arrays.items():
+                mask = teams == team
+                if not mask.any():
+                    continue
+                idx = np.searchsorted(team_dates, dates[mask], side='left') - 1
+                valid = (idx >= 0) & ~np.isnat(dates[mask])
+                safe_idx = np.clip(idx, 0, None)
+                decayed = self._decayed(team_scores[safe_idx], team_weights[safe_idx], dates[mask] - team_dates[safe_idx])
+                values[mask] = np.where(valid, decayed, default)
+            df[f'{side}_media_score'] = values
+        return df
+
+
+def join_media_scores(df, history_path, date_col='date'):
+    """학습 노트북용: 이력 파일이 없으면 0.0 으로 채운 컬럼 추가"""
+    return MediaScoreHistory.from_csv(history_path).join(df, date_col=date_col)
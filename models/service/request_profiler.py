@@ -0,0 +1,100 @@
+import cProfile
+import io
+import os
+import pstats
+import random
+import threading
+import time
+from collections import deque
+
+from flask import g, jsonify, request
+
+
+class RequestProfiler:
+    """
+    요청 단위 cProfile 프로파일러 (opt-in).
+    관리자 헤더(X-Profile-Token) 또는 샘플링 비율로 선택된 요청만 프로파일링하고,
+    결과(.prof)를 로컬 디렉터리에 최대 max_files 개까지 순환 저장합니다.
+    init_profiling 을 호출하지 않으면 Flask 훅이 등록되지 않으므로 오버헤드가 없습니다.
+    """
+
+    HEADER = "X-Profile-Token"
+
+    def __init__(self, profile_dir="profiles", sample_rate=0.0, admin_token=None, max_files=200):
+        self.profile_dir = profile_dir
+        self.sample_rate = sample_rate
+        self.admin_token = admin_token
+        self.max_files = max_files
+        self.records = deque(maxlen=max_files)
+        self._lock = threading.Lock()
+        os.makedirs(profile_dir, exist_ok=True)
+
+    def _should_profile(self):
+        if self.admin_token and request.headers.get(self.HEADER) == self.admin_token:
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def before_request(self):
+        if request.endpoint == "profile_summary" or not self._should_profile():
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # 다른 스레드에서 이미 프로파일러가 동작 중인 경우 (Python 3.12+) 이번 요청은 건너뜀
+            return
+        g.request_profiler = profiler
+        g.request_profile_started = time.perf_counter()
+
+    def after_request(self, response):
+        profiler = g.pop("request_profiler", None)
+        if profiler is None:
+            return response
+        profiler.disable()
+        elapsed = time.perf_counter() - g.pop("request_profile_started")
+
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        filename = f"{timestamp}_{int(elapsed * 1000)}ms_{request.endpoint}_{threading.get_ident()}.prof"
+        path = os.path.join(self.profile_dir, filename)
+        profiler.dump_stats(path)
+
+        # 누적 시간 기준 상위 함수 요약
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(5)
+
+        with self._lock:
+            if len(self.records) == self.records.maxlen:
+                oldest = self.records[0]
+                if os.path.exists(oldest["file"]):
+                    os.remove(oldest["file"])
+            self.records.append({
+                "file": path,
+                "path": request.path,
+                "endpoint": request.endpoint,
+                "status": response.status_code,
+                "duration_ms": round(elapsed * 1000, 2),
+                "timestamp": timestamp,
+                "top_functions": stream.getvalue()
+            })
+        return response
+
+    def summary(self):
+        if not self.admin_token or request.headers.get(self.HEADER) != self.admin_token:
+            return jsonify({"error": "Forbidden"}), 403
+        limit = int(request.args.get("limit", 20))
+        with self._lock:
+            slowest = sorted(self.records, key=lambda r: r["duration_ms"], reverse=True)[:limit]
+        return jsonify({"count": len(self.records), "slowest": slowest})
+
+
+def init_profiling(app, profile_dir="profiles", sample_rate=0.0, admin_token=None, max_files=200):
+    """
+    Flask 앱에 요청 프로파일링 훅 등록.
+    요약 엔드포인트(/admin/profiles)는 파일 경로 / 내부 함수 정보를 노출하므로 admin_token 이 설정된 경우에만 등록합니다.
+    """
+    profiler = RequestProfiler(profile_dir, sample_rate, admin_token, max_files)
+    app.before_request(profiler.before_request)
+    app.after_request(profiler.after_request)
+    if admin_token:
+        app.add_url_rule("/admin/profiles", "profile_summary", profiler.summary, methods=["GET"])
+    return profiler